@@ -100,10 +100,14 @@ def _text(el: Optional[ET.Element]) -> str:
         return ""
     return (el.text or "").strip()
 
+_URL_RE = re.compile(r"https?://\S+")
+_TITLE_PUNCT_RE = re.compile(r"[\s.,!?:;\-–—]+")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
 def _normalize_title_for_fp(title: str) -> str:
     t = (title or "").strip().lower()
-    t = re.sub(r"https?://\S+", "", t)
-    t = re.sub(r"[\s\.\,\!\?\:\;\-–—]+", " ", t)
+    t = _URL_RE.sub("", t)
+    t = _TITLE_PUNCT_RE.sub(" ", t)
     t = " ".join(t.split())
     return t[:220]
 
@@ -585,7 +589,7 @@ def _fallback_insert_raw_card(raw: Dict[str, Any], language: str) -> Optional[in
         return None
 
     summary = (raw.get("summary") or "").strip()
-    summary = re.sub(r"<[^>]+>", " ", summary)
+    summary = _HTML_TAG_RE.sub(" ", summary)
     summary = _clean_text(summary, 2000)
     if not summary:
         summary = "Источник: " + (raw.get("url") or "")
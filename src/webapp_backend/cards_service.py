@@ -1,17 +1,20 @@
 # file: src/webapp_backend/cards_service.py
 import base64
+import copy
 import hashlib
 import json
 import logging
 import os
 import re
+import threading
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from cachetools import TTLCache
 from supabase import Client
 
 from .profile_service import get_interest_tags_for_user
-from .openai_client import generate_cards_for_tags, is_configured as openai_is_configured
+from .openai_client import CARDS_CACHE_TTL_SECONDS, generate_cards_for_tags, is_configured as openai_is_configured
 
 logger = logging.getLogger(__name__)
 
@@ -967,6 +970,16 @@ def _apply_dedup_and_diversity(
 
 # ===================== Вставка LLM-карточек в DB =====================
 
+# generate_cards_for_tags отдаёт из своего кэша (CARDS_CACHE_TTL_SECONDS) те же карточки повторно —
+# уже вставленные в этом процессе второй раз не вставляем, а возвращаем их строки из DB.
+_inserted_cards: TTLCache = TTLCache(maxsize=2048, ttl=CARDS_CACHE_TTL_SECONDS * 2)
+_inserted_cards_lock = threading.Lock()
+
+
+def _inserted_card_key(row: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (row.get("title"), row.get("body"), row.get("source_ref"), row.get("language"), row.get("source_type"))
+
+
 def _insert_cards_into_db(
     supabase: Client,
     cards: List[Dict[str, Any]],
@@ -1038,18 +1051,35 @@ def _insert_cards_into_db(
     if not payload:
         return []
 
+    reused: List[Dict[str, Any]] = []
+    fresh: List[Dict[str, Any]] = []
+    with _inserted_cards_lock:
+        for row in payload:
+            prev = _inserted_cards.get(_inserted_card_key(row))
+            if prev is not None:
+                reused.append(copy.deepcopy(prev))
+            else:
+                fresh.append(row)
+    if not fresh:
+        logger.info("All %d generated cards are already in DB, skipping insert", len(reused))
+        return reused
+
     try:
-        resp = supabase.table("cards").insert(payload).execute()
+        resp = supabase.table("cards").insert(fresh).execute()
     except Exception:
         logger.exception("Error inserting generated cards into Supabase")
-        return []
+        return reused
 
     data = getattr(resp, "data", None)
     if data is None:
         data = getattr(resp, "model", None)
     data = data or []
-    logger.info("Inserted %d generated cards into DB", len(data))
-    return data
+    with _inserted_cards_lock:
+        for row in data:
+            if isinstance(row, dict):
+                _inserted_cards[_inserted_card_key(row)] = copy.deepcopy(row)
+    logger.info("Inserted %d generated cards into DB (%d already there)", len(data), len(reused))
+    return reused + data
 
 
 # ===================== "Интересная" выдача (blend) =====================
@@ -7,6 +7,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from supabase import Client
 
+from .profile_service import invalidate_profile_cache
+
 CARD_FIELDS = (
     "id,source_type,source_ref,title,body,tags,category,language,"
     "importance_score,created_at,is_active,meta,fingerprint,quality_score,content_type,nsfw"
@@ -98,6 +100,7 @@ def _upsert_user_embedding(supabase: Client, user_id: int, emb: List[float], mod
         "updated_at": now,
     }
     supabase.table("user_profiles").upsert(payload, on_conflict="user_id").execute()
+    invalidate_profile_cache(user_id)
 
 
 def _build_user_vector_from_events(
@@ -1,13 +1,51 @@
 # file: src/webapp_backend/openai_client.py
+import asyncio
+import atexit
+import concurrent.futures
+import copy
+import functools
+import hashlib
 import json
 import logging
+import math
 import os
+import random
 import re
+import threading
 import time
-import urllib.error
-import urllib.request
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+import uuid
+import weakref
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TypedDict, Union
+
+import httpx
+from cachetools import TTLCache
+
+try:
+    # HTTP/2 для httpx (httpx[http2]); без h2 — пул keep-alive соединений HTTP/1.1
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Rust-парсер JSON: умеет разбирать оборванный ответ модели (partial mode)
+    import jiter
+except ImportError:
+    jiter = None
+
+try:
+    # общий кэш нормализованных статей между процессами/запусками (REDIS_URL)
+    import redis
+except ImportError:
+    redis = None
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +71,9 @@ ALLOWED_TAGS_CANONICAL = [
     "education",
     "city",
 ]
-ALLOWED_TAGS_SET = set(ALLOWED_TAGS_CANONICAL)
+ALLOWED_TAGS_SET = frozenset(ALLOWED_TAGS_CANONICAL)
+# allowlist для промптов собираем один раз
+_ALLOWED_TAGS_PROMPT = ", ".join(ALLOWED_TAGS_CANONICAL)
 
 TAG_ALIASES = {
     "crypto": "finance",
@@ -50,6 +90,38 @@ TAG_ALIASES = {
     "education_career": "education",
 }
 
+# тег/алиас -> канонический тег; всё, чего нет в карте, отбрасывается (один lookup на тег)
+_TAG_CANONICAL_MAP = {
+    k: v for k, v in ((k, TAG_ALIASES.get(k, k)) for k in ALLOWED_TAGS_SET | TAG_ALIASES.keys()) if v in ALLOWED_TAGS_SET
+}
+
+# регэкспы для чистки текста карточек: компилируем один раз на модуль
+# только то, что реально надо менять: одиночный пробел не трогаем
+_RE_WS = re.compile(r"[ \t]{2,}|\t")
+_RE_NL = re.compile(r"\n{3,}")
+# пунктуация заголовка -> пробел; пробельные прогоны схлопывает split()
+_TITLE_PUNCT_TRANS = str.maketrans(dict.fromkeys(".,!?:;-–—", " "))
+
+
+# Форма возвращаемых карточек. Обычные dict'ы (вызывающий код и кэш работают с dict),
+# TypedDict — только для статической проверки ключей, в рантайме ничего не стоит.
+class Card(TypedDict):
+    title: str
+    body: str
+    tags: List[str]
+    importance_score: float
+    language: str
+    quality: str
+
+
+class NormalizedCard(Card):
+    source_name: Optional[str]
+    input_language_hint: str
+
+
+class WikipediaCard(NormalizedCard):
+    why_now: str
+
 
 def get_canonical_topics() -> List[str]:
     """Единственный источник правды для топиков/тем EYYE."""
@@ -57,7 +129,8 @@ def get_canonical_topics() -> List[str]:
 
 
 # ==========
-# ДИНАМИЧЕСКИЙ конфиг (env читается во время вызова)
+# ДИНАМИЧЕСКИЙ конфиг (env читается при первом вызове, не при импорте — load_dotenv успевает отработать)
+# Основные значения кэшируются на процесс; reset_config_cache() — перечитать env (тесты, смена конфига).
 # ==========
 
 
@@ -68,23 +141,34 @@ def _env(name: str, default: Optional[str] = None) -> str:
     return str(v)
 
 
+@functools.lru_cache(maxsize=1)
 def _get_openai_api_key() -> str:
     return _env("OPENAI_API_KEY", "").strip()
 
 
+@functools.lru_cache(maxsize=1)
 def _get_openai_model() -> str:
     return _env("OPENAI_MODEL", "gpt-4.1-mini").strip() or "gpt-4.1-mini"
 
 
+@functools.lru_cache(maxsize=1)
+def _get_openai_normalize_model() -> str:
+    # простые задачи (нормализация поста, 1–3 карточки) — на модели меньше и дешевле
+    return _env("OPENAI_NORMALIZE_MODEL", "gpt-4o-mini").strip() or "gpt-4o-mini"
+
+
+@functools.lru_cache(maxsize=1)
 def _get_openai_wikipedia_model() -> str:
-    base = _get_openai_model()
-    return _env("OPENAI_WIKIPEDIA_MODEL", base).strip() or base
+    # пусто — значит малая модель с авто-переключением на основную (см. _pick_small_model)
+    return _env("OPENAI_WIKIPEDIA_MODEL", "").strip()
 
 
+@functools.lru_cache(maxsize=1)
 def _get_openai_base_url() -> str:
     return (_env("OPENAI_BASE_URL", "https://api.openai.com/v1") or "https://api.openai.com/v1").rstrip("/")
 
 
+@functools.lru_cache(maxsize=1)
 def _get_openai_timeout() -> float:
     try:
         return float(_env("OPENAI_TIMEOUT_SECONDS", "30"))
@@ -92,18 +176,35 @@ def _get_openai_timeout() -> float:
         return 30.0
 
 
+@functools.lru_cache(maxsize=1)
 def _get_output_language() -> str:
     lang = (_env("EYYE_OUTPUT_LANGUAGE", "ru") or "ru").strip().lower()
     return "ru" if lang not in ("ru", "en") else lang
 
 
+def reset_config_cache() -> None:
+    for getter in (
+        _get_openai_api_key,
+        _get_openai_model,
+        _get_openai_normalize_model,
+        _get_openai_wikipedia_model,
+        _get_openai_base_url,
+        _get_openai_timeout,
+        _get_output_language,
+        _chat_completions_url,
+        _model_is_deployed,
+    ):
+        getter.cache_clear()
+
+
 # ✅ Backward-compatible aliases (чтобы твой код ниже не падал)
 def _openai_model() -> str:
     return _get_openai_model()
 
 
 def _openai_wikipedia_model() -> str:
-    return _get_openai_wikipedia_model()
+    # пересказ статьи по жёсткой схеме — узкая задача, основная модель для неё избыточна
+    return _get_openai_wikipedia_model() or _pick_small_model()
 
 
 def _output_language() -> str:
@@ -114,85 +215,343 @@ def is_configured() -> bool:
     return bool(_get_openai_api_key())
 
 
+def _json_dumps_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+    # orjson сразу отдаёт UTF-8 bytes и не эскейпит кириллицу
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys).encode("utf-8")
+
+
+def _json_dumps_str(obj: Any, sort_keys: bool = False) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys)
+
+
+def _json_loads(data: Union[str, bytes, bytearray]) -> Any:
+    # orjson.JSONDecodeError — подкласс json.JSONDecodeError/ValueError
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _clamp01(x: float) -> float:
-    try:
+    # обычно модель отдаёт число или null — разбираем их без try/except
+    if isinstance(x, (int, float)):
         v = float(x)
-    except Exception:
+    elif x is None:
+        return 0.5
+    else:
+        try:
+            v = float(x)
+        except (TypeError, ValueError):
+            return 0.5
+    # NaN/inf от модели ("importance_score": NaN) — как отсутствующее значение
+    if not math.isfinite(v):
         return 0.5
-    return max(0.0, min(1.0, v))
+    return 0.0 if v < 0.0 else 1.0 if v > 1.0 else v
+
+
+def _collapse_ws(text: str) -> str:
+    text = text.strip()
+    # в типичном тексте замен нет — проверка подстроки дешевле прохода регэкспа
+    if "  " in text or "\t" in text:
+        text = _RE_WS.sub(" ", text)
+    if "\n\n\n" in text:
+        text = _RE_NL.sub("\n\n", text)
+    return text
 
 
 def _clean_text(s: Any, max_len: int) -> str:
-    text = str(s or "").strip()
-    if not text:
-        return ""
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    # длинный вход (сырой пост/статья) режем заранее с запасом, но обрезаем до max_len только
+    # после схлопывания пробелов; если запаса не хватило (вход почти из одних пробелов) — берём весь
+    raw = str(s or "")
+    bound = max_len * 4
+    text = _collapse_ws(raw[:bound])
+    if len(text) < max_len and len(raw) > bound:
+        text = _collapse_ws(raw)
     return text[:max_len].strip()
 
 
+def _trim_for_llm(text: Any, max_chars: int) -> str:
+    """
+    Длинный пост/статью отдаём модели как начало + хвост: суть обычно в первых абзацах,
+    а входные токены — основная часть латентности и цены вызова.
+    """
+    text = str(text or "").strip()
+    if len(text) <= max_chars:
+        return text
+    return f"{text[: max_chars // 2].rstrip()}\n[...]\n{text[-(max_chars // 4):].lstrip()}"
+
+
+def _split_tags_string(tags: str) -> List[str]:
+    """
+    Модель иногда отдаёт tags строкой: '["tech", "science"]' или 'tech, science'.
+    JSON-массив разбираем одним вызовом парсера, ручной split — только если это не JSON.
+    """
+    text = tags.strip()
+    if text.startswith("["):
+        try:
+            parsed = _json_loads(text)
+            if isinstance(parsed, list):
+                return [str(t) for t in parsed if t]
+        except ValueError:
+            text = text.strip("[]")
+    return [t.strip().strip("'\"") for t in text.split(",")]
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_tags_cached(tags: Union[str, Tuple[Any, ...]]) -> Tuple[str, ...]:
+    tags_list = _split_tags_string(tags) if isinstance(tags, str) else tags
+    # модель почти всегда отдаёт строки — str() только для нестроковых элементов
+    cleaned = ((t if isinstance(t, str) else str(t or "")).strip().lower() for t in tags_list)
+    # dict.fromkeys — дедуп с сохранением порядка за один проход
+    return tuple(dict.fromkeys(v for v in map(_TAG_CANONICAL_MAP.get, cleaned) if v is not None))
+
+
 def _normalize_tag_list(tags: Any, fallback: Optional[List[str]] = None) -> List[str]:
-    fallback = fallback or []
+    # у карточек одного ответа теги обычно повторяются: результат кэшируем по кортежу входа
     if not tags:
-        tags_list: List[str] = []
+        key: Union[str, Tuple[Any, ...]] = ()
     elif isinstance(tags, str):
-        tags_list = [tags]
+        key = tags
     elif isinstance(tags, (list, tuple)):
-        tags_list = [str(t) for t in tags]
+        key = tuple(tags)
     else:
-        tags_list = []
+        key = ()
 
-    out: List[str] = []
-    for t in tags_list:
-        v = str(t or "").strip().lower()
-        if not v:
-            continue
-        v = TAG_ALIASES.get(v, v)
-        if v in ALLOWED_TAGS_SET:
-            out.append(v)
-
-    seen = set()
-    deduped: List[str] = []
-    for t in out:
-        if t not in seen:
-            seen.add(t)
-            deduped.append(t)
-
-    if not deduped:
-        fb = []
-        for t in fallback:
-            v = str(t or "").strip().lower()
-            v = TAG_ALIASES.get(v, v)
-            if v in ALLOWED_TAGS_SET:
-                fb.append(v)
-        seen2 = set()
-        deduped2 = []
-        for t in fb:
-            if t not in seen2:
-                seen2.add(t)
-                deduped2.append(t)
-        return deduped2
-
-    return deduped
+    try:
+        deduped = list(_normalize_tags_cached(key))
+    except TypeError:
+        # нехэшируемые элементы (вложенные списки/объекты от модели) — без кэша
+        deduped = list(_normalize_tags_cached.__wrapped__(key))
+    if deduped or not fallback:
+        return deduped
+    # fallback проходит ту же нормализацию (алиасы, allowlist, дедуп)
+    return _normalize_tag_list(fallback)
+
+
+# ==========
+# HTTP-клиент: один пул соединений на процесс (TLS-рукопожатие платим один раз)
+# ==========
+
+_http_client: Optional[httpx.Client] = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    global _http_client
+    if _http_client is None:
+        with _HTTP_CLIENT_LOCK:
+            if _http_client is None:
+                # ключ, base_url и таймаут читаются из env на каждый запрос — в клиент их не зашиваем
+                # keepalive_expiry как у async-клиента: дефолтные 5с рвут соединение между редкими вызовами,
+                # и каждый следующий снова платит TCP+TLS; 32 keep-alive хватает на OPENAI_BULK_THREADS
+                _http_client = httpx.Client(
+                    http2=_HTTP2_AVAILABLE,
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=90),
+                )
+                atexit.register(close_http_client)
+    return _http_client
+
+
+def close_http_client() -> None:
+    global _http_client
+    with _HTTP_CLIENT_LOCK:
+        if _http_client is not None:
+            _http_client.close()
+        _http_client = None
+
+
+def _read_capped(resp: httpx.Response, max_bytes: int) -> bytes:
+    """
+    Читает тело ответа чанками, но не больше max_bytes + 1 байт — дальше не качаем.
+    Отдаём bytes, а не bytearray: splitlines()/decode дальше должны видеть обычные bytes.
+    """
+    buf = bytearray()
+    for chunk in resp.iter_bytes():
+        buf += chunk
+        if len(buf) > max_bytes:
+            break
+    return bytes(buf)
 
 
 # ==========
 # OpenAI: chat.completions
 # ==========
 
+# 429 и временные 5xx обычно проходят со второй попытки — ретраим, остальные 4xx нет
+OPENAI_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
 
-def call_openai_chat(payload: Dict[str, Any]) -> Dict[str, Any]:
-    api_key = _get_openai_api_key()
-    if not api_key:
-        logger.warning("OPENAI_API_KEY is not set, skipping OpenAI call")
-        return {}
 
-    url = _get_openai_base_url().rstrip("/") + "/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
+def _get_openai_max_retries() -> int:
+    try:
+        return max(0, int(_env("OPENAI_MAX_RETRIES", "2")))
+    except Exception:
+        return 2
+
+
+def _get_openai_max_response_bytes() -> int:
+    # потолок на тело ответа: баг апстрима не должен раздувать память при параллельных вызовах
+    try:
+        return max(1024, int(_env("OPENAI_MAX_RESP_BYTES", str(512 * 1024))))
+    except Exception:
+        return 512 * 1024
+
+
+_RATELIMIT_RESET_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_RATELIMIT_RESET_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _retry_after_seconds(headers: Any) -> Optional[float]:
+    """
+    Сколько сервер просит подождать: Retry-After (секунды), иначе
+    x-ratelimit-reset-requests / x-ratelimit-reset-tokens в формате OpenAI ("1s", "6m0s", "20ms").
+    """
+    if not headers:
+        return None
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    for name in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens"):
+        value = headers.get(name)
+        if not value:
+            continue
+        parts = _RATELIMIT_RESET_RE.findall(value)
+        if parts:
+            return sum(float(num) * _RATELIMIT_RESET_UNITS[unit] for num, unit in parts)
+    return None
+
+
+def _retry_delay(attempt: int, retry_after: Optional[float]) -> float:
+    """Пауза перед повтором: подсказка сервера (до 60s), иначе экспонента 1..10s + jitter."""
+    if retry_after is not None:
+        return min(60.0, retry_after)
+    return min(10.0, float(2 ** (attempt - 1))) + random.uniform(0.0, 1.0)
 
+
+# ==========
+# Circuit breaker: при серии 429/5xx/сетевых ошибок не ходим в сеть,
+# пока не истечёт окно; после окна пропускаем один пробный запрос
+# ==========
+
+OPENAI_BREAKER_THRESHOLD = 5
+
+_BREAKER_LOCK = threading.Lock()
+_breaker = {"open_until": 0.0, "consec_fail": 0}
+
+
+def _breaker_allow() -> bool:
+    with _BREAKER_LOCK:
+        if _breaker["consec_fail"] < OPENAI_BREAKER_THRESHOLD:
+            return True
+        now = time.monotonic()
+        if now < _breaker["open_until"]:
+            return False
+        # окно истекло: этот вызов — проба, остальных держим, пока она не вернётся
+        _breaker["open_until"] = now + _get_openai_timeout()
+        return True
+
+
+def _breaker_success() -> None:
+    with _BREAKER_LOCK:
+        if _breaker["consec_fail"] >= OPENAI_BREAKER_THRESHOLD:
+            logger.info("OpenAI circuit breaker closed")
+        _breaker["consec_fail"] = 0
+        _breaker["open_until"] = 0.0
+
+
+def _breaker_failure(retry_after: Optional[float]) -> None:
+    with _BREAKER_LOCK:
+        _breaker["consec_fail"] += 1
+        fails = _breaker["consec_fail"]
+        if fails < OPENAI_BREAKER_THRESHOLD:
+            return
+        pause = retry_after if retry_after is not None else min(60.0, float(2 ** fails))
+        _breaker["open_until"] = time.monotonic() + pause
+    logger.warning("OpenAI circuit breaker open for %.1fs after %d consecutive failures", pause, fails)
+
+
+# ==========
+# Дисковый кэш ответов chat.completions (ключ — хэш тела запроса)
+# ==========
+
+# выше этой температуры ответы заметно разные — кэшировать их нельзя
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.3
+
+
+def _get_response_cache_ttl() -> float:
+    try:
+        return max(0.0, float(_env("OPENAI_RESPONSE_CACHE_TTL_SECONDS", str(7 * 24 * 3600))))
+    except Exception:
+        return 7 * 24 * 3600.0
+
+
+def _response_cache_path(body: Dict[str, Any]) -> Tuple[Optional[Path], float]:
+    """
+    (путь, ttl в секундах; 0 — бессрочно) или (None, 0), если кэш для запроса выключен.
+
+    - Dev/test: OPENAI_CACHE_REPLAY=1 — все ответы складываются в OPENAI_CACHE_DIR и не протухают.
+    - Прод: OPENAI_RESPONSE_CACHE_DIR — почти детерминированные запросы (temperature <= 0.3,
+      без stream): одна и та же статья из нескольких фидов не оплачивается повторно.
+    """
+    if _env("OPENAI_CACHE_REPLAY", "").strip().lower() in ("1", "true", "yes"):
+        cache_dir = _env("OPENAI_CACHE_DIR", "").strip() or os.path.join("~", ".cache", "eyye", "openai")
+        ttl = 0.0
+    else:
+        cache_dir = _env("OPENAI_RESPONSE_CACHE_DIR", "").strip()
+        if not cache_dir or body.get("stream") or body["temperature"] > RESPONSE_CACHE_MAX_TEMPERATURE:
+            return None, 0.0
+        ttl = _get_response_cache_ttl()
+    key = hashlib.blake2b(_json_dumps_bytes(body, sort_keys=True), digest_size=16).hexdigest()
+    return Path(cache_dir).expanduser() / f"{key}.json", ttl
+
+
+def _response_cache_load(path: Path, ttl: float) -> Optional[Dict[str, Any]]:
+    try:
+        if ttl and time.time() - path.stat().st_mtime > ttl:
+            return None
+        obj = _json_loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning("Broken OpenAI response cache file %s, ignoring", path)
+        return None
+    logger.info("OpenAI chat.completions served from cache %s", path)
+    return obj
+
+
+def _response_cache_store(path: Path, obj: Dict[str, Any]) -> None:
+    # ошибки/обрезанные ответы не кэшируем
+    choices = obj.get("choices") or [{}]
+    if choices[0].get("finish_reason") == "length":
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(_json_dumps_bytes(obj))
+        tmp.replace(path)
+    except Exception:
+        logger.warning("Failed to write OpenAI response cache %s", path, exc_info=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _chat_completions_url() -> str:
+    return _get_openai_base_url().rstrip("/") + "/chat/completions"
+
+
+_BASE_HEADERS = {"Content-Type": "application/json"}
+
+
+def _auth_headers(api_key: str) -> Dict[str, str]:
+    return {**_BASE_HEADERS, "Authorization": f"Bearer {api_key}"}
+
+
+def _build_chat_body(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """payload (наш формат, допускает max_output_tokens/input) → тело chat.completions."""
     model = payload.get("model") or _get_openai_model()
 
     messages = payload.get("messages")
@@ -227,35 +586,166 @@ def call_openai_chat(payload: Dict[str, Any]) -> Dict[str, Any]:
     if "response_format" in payload:
         body["response_format"] = payload["response_format"]
 
-    data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+    if payload.get("stream"):
+        body["stream"] = True
 
-    started_at = datetime.now(timezone.utc)
-    try:
-        req = urllib.request.Request(url, data=data, headers=headers, method="POST")
-        with urllib.request.urlopen(req, timeout=_get_openai_timeout()) as resp:
-            raw = resp.read().decode("utf-8")
-        elapsed = (datetime.now(timezone.utc) - started_at).total_seconds()
-        logger.info("OpenAI chat.completions call OK (%.2fs)", elapsed)
-        logger.debug("OpenAI raw response (first %d chars): %s", RAW_LOG_MAX_LEN, raw[:RAW_LOG_MAX_LEN])
-        return json.loads(raw)
-    except urllib.error.HTTPError as e:
-        elapsed = (datetime.now(timezone.utc) - started_at).total_seconds()
-        try:
-            error_body = e.read().decode("utf-8", errors="replace")
-        except Exception:
-            error_body = "<no body>"
-        logger.error(
-            "OpenAI HTTPError in chat.completions (%.2fs), code=%s, body=%s",
-            elapsed,
-            e.code,
-            error_body[:1000],
-        )
+    if payload.get("service_tier"):
+        body["service_tier"] = payload["service_tier"]
+
+    # стабильный ключ маршрутизации: запросы с общим system prompt попадают на один кэш префикса
+    if payload.get("prompt_cache_key"):
+        body["prompt_cache_key"] = payload["prompt_cache_key"]
+
+    return body
+
+
+def call_openai_chat(payload: Dict[str, Any]) -> Dict[str, Any]:
+    api_key = _get_openai_api_key()
+    if not api_key:
+        logger.warning("OPENAI_API_KEY is not set, skipping OpenAI call")
         return {}
-    except Exception as e:
-        elapsed = (datetime.now(timezone.utc) - started_at).total_seconds()
-        logger.exception("Error calling OpenAI chat.completions (%.2fs): %s", elapsed, e)
+
+    url = _chat_completions_url()
+    headers = _auth_headers(api_key)
+    body = _build_chat_body(payload)
+    stream = bool(body.get("stream"))
+
+    data = _json_dumps_bytes(body)
+
+    cache_path, cache_ttl = _response_cache_path(body)
+    if cache_path is not None:
+        cached = _response_cache_load(cache_path, cache_ttl)
+        if cached is not None:
+            return cached
+
+    if not _breaker_allow():
+        logger.warning("OpenAI circuit breaker is open, skipping chat.completions call")
         return {}
 
+    obj = _post_chat_completions(url, data, headers, stream, body["model"])
+    if obj and cache_path is not None:
+        _response_cache_store(cache_path, obj)
+    return obj
+
+
+def _post_chat_completions(
+    url: str, data: bytes, headers: Dict[str, str], stream: bool, model: str
+) -> Dict[str, Any]:
+    client = _get_http_client()
+    max_bytes = _get_openai_max_response_bytes()
+    attempts = _get_openai_max_retries() + 1
+    for attempt in range(1, attempts + 1):
+        started_ns = time.perf_counter_ns()
+        try:
+            with client.stream("POST", url, content=data, headers=headers, timeout=_get_openai_timeout()) as resp:
+                status = resp.status_code
+                if status == 200 and stream:
+                    obj = _read_chat_stream(resp.iter_lines())
+                    elapsed = (time.perf_counter_ns() - started_ns) / 1e9
+                    logger.info("OpenAI chat.completions stream OK (%.2fs)", elapsed)
+                    _breaker_success()
+                    return obj
+                raw = _read_capped(resp, max_bytes)
+            elapsed = (time.perf_counter_ns() - started_ns) / 1e9
+
+            if status == 200:
+                _breaker_success()
+                if len(raw) > max_bytes:
+                    logger.error("OpenAI chat.completions response exceeds %d bytes, dropping it", max_bytes)
+                    return {}
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "OpenAI raw response (first %d bytes): %s",
+                        RAW_LOG_MAX_LEN,
+                        raw[:RAW_LOG_MAX_LEN].decode("utf-8", errors="replace"),
+                    )
+                obj = _json_loads(raw)
+                # cached_tokens > 0 => префикс промпта попал в prompt cache OpenAI
+                usage = obj.get("usage") or {}
+                logger.info(
+                    "OpenAI chat.completions call OK (%.2fs), prompt_tokens=%s, cached_tokens=%s",
+                    elapsed,
+                    usage.get("prompt_tokens"),
+                    (usage.get("prompt_tokens_details") or {}).get("cached_tokens"),
+                )
+                return obj
+
+            logger.error(
+                "OpenAI HTTP %s in chat.completions (%.2fs), body=%s",
+                status,
+                elapsed,
+                raw[:1000].decode("utf-8", errors="replace"),
+            )
+            if status not in OPENAI_RETRY_STATUS_CODES:
+                _record_model_http_error(model, status)
+                return {}
+            retry_after = _retry_after_seconds(resp.headers)
+            _breaker_failure(retry_after)
+            if attempt >= attempts:
+                return {}
+        except httpx.TransportError as e:
+            # таймауты, обрывы соединения, ошибки DNS/TLS
+            elapsed = (time.perf_counter_ns() - started_ns) / 1e9
+            logger.error("OpenAI network error in chat.completions (%.2fs): %s", elapsed, e)
+            retry_after = None
+            _breaker_failure(retry_after)
+            if attempt >= attempts:
+                return {}
+        except Exception as e:
+            elapsed = (time.perf_counter_ns() - started_ns) / 1e9
+            logger.exception("Error calling OpenAI chat.completions (%.2fs): %s", elapsed, e)
+            return {}
+
+        delay = _retry_delay(attempt, retry_after)
+        logger.warning("Retrying OpenAI chat.completions in %.1fs (attempt %d/%d)", delay, attempt + 1, attempts)
+        time.sleep(delay)
+        if not _breaker_allow():
+            logger.warning("OpenAI circuit breaker opened, giving up on chat.completions retries")
+            return {}
+
+    return {}
+
+
+def _read_chat_stream(lines: Any) -> Dict[str, Any]:
+    """
+    Собирает SSE-поток chat.completions (stream=true) в обычный ответ
+    {"choices": [{"message": {...}, "finish_reason": ...}]}.
+    Выходим сразу, как только пришёл finish_reason — хвост потока не ждём.
+    """
+    parts: List[str] = []
+    finish_reason: Optional[str] = None
+    for line in lines:
+        if isinstance(line, (bytes, bytearray)):
+            line = line.decode("utf-8", errors="replace")
+        line = line.strip()
+        if not line.startswith("data:"):
+            continue
+        chunk = line[5:].strip()
+        if chunk == "[DONE]":
+            break
+        try:
+            event = _json_loads(chunk)
+        except ValueError:
+            continue
+        for choice in event.get("choices") or []:
+            delta = choice.get("delta") or {}
+            piece = delta.get("content")
+            if isinstance(piece, str):
+                parts.append(piece)
+            if choice.get("finish_reason"):
+                finish_reason = choice["finish_reason"]
+        if finish_reason:
+            break
+
+    return {
+        "choices": [
+            {
+                "message": {"role": "assistant", "content": "".join(parts)},
+                "finish_reason": finish_reason,
+            }
+        ]
+    }
+
 
 def _extract_message_content(resp_json: Dict[str, Any]) -> str:
     if not resp_json:
@@ -264,46 +754,80 @@ def _extract_message_content(resp_json: Dict[str, Any]) -> str:
     if not isinstance(choices, list) or not choices:
         logger.error("No choices in OpenAI response")
         return ""
-    message = choices[0].get("message") or {}
-    content = message.get("content")
-
-    if isinstance(content, list):
-        parts: List[str] = []
-        for part in content:
-            if isinstance(part, dict):
-                text = part.get("text")
-                if isinstance(text, dict):
-                    value = text.get("value")
-                    if isinstance(value, str):
-                        parts.append(value)
-                elif isinstance(text, str):
-                    parts.append(text)
-            elif isinstance(part, str):
-                parts.append(part)
-        return "\n".join(parts)
-
+    content = (choices[0].get("message") or {}).get("content")
+    # обычный ответ chat.completions — строка: отдаём сразу, без разбора частей
     if isinstance(content, str):
         return content
-
+    if isinstance(content, list):
+        return "\n".join(_iter_content_parts(content))
     return str(content or "")
 
 
+def _iter_content_parts(content: List[Any]) -> Iterator[str]:
+    for part in content:
+        if isinstance(part, str):
+            yield part
+        elif isinstance(part, dict):
+            text = part.get("text")
+            if isinstance(text, str):
+                yield text
+            elif isinstance(text, dict) and isinstance(text.get("value"), str):
+                yield text["value"]
+
+
+# raw_decode разбирает первый JSON-объект с заданной позиции и игнорирует хвост — без копии подстроки
+_JSON_DECODER = json.JSONDecoder()
+
+
 def _try_loose_json_parse(content: str) -> Optional[Dict[str, Any]]:
     if not content:
         return None
+    first = content.find("{")
+    if first == -1:
+        return None
+    try:
+        parsed, _ = _JSON_DECODER.raw_decode(content, first)
+    except ValueError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _parse_model_json(content: str) -> Any:
+    """
+    JSON из ответа модели: строгий разбор, а если вокруг объекта мусор (```json, пояснения,
+    второй объект) — один повтор с первой "{" через raw_decode. None — если JSON-объекта нет.
+    """
+    if not content:
+        return None
+    # ```json / текст перед объектом: строгий разбор заведомо упадёт — не платим за исключение
+    if content.lstrip()[:1] not in ("{", "["):
+        return _try_loose_json_parse(content)
+    try:
+        return _json_loads(content)
+    except ValueError:
+        return _try_loose_json_parse(content)
+
+
+def _try_partial_json_parse(content: str) -> Any:
+    """
+    Разбор недописанного JSON (ответ модели оборвался по max_tokens):
+    незакрытые скобки и оборванная последняя строка допускаются.
+    Один проход jiter вместо ручного поиска скобок.
+    """
+    if not content or jiter is None:
+        return None
     text = content.strip()
     first = text.find("{")
-    last = text.rfind("}")
-    if first == -1 or last == -1 or last <= first:
+    if first == -1:
         return None
-    candidate = text[first : last + 1]
     try:
-        parsed = json.loads(candidate)
-        if isinstance(parsed, dict):
-            return parsed
-    except Exception:
+        return jiter.from_json(
+            text[first:].encode("utf-8"),
+            partial_mode="trailing-strings",
+            cache_mode="keys",
+        )
+    except ValueError:
         return None
-    return None
 
 
 # ==========
@@ -335,16 +859,19 @@ def call_openai_embeddings(texts: List[str], model: Optional[str] = None) -> Lis
         "model": model or _get_openai_embedding_model(),
         "input": texts,
     }
-    data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+    data = _json_dumps_bytes(body)
 
-    started_at = datetime.now(timezone.utc)
+    started_ns = time.perf_counter_ns()
     try:
-        req = urllib.request.Request(url, data=data, headers=headers, method="POST")
-        with urllib.request.urlopen(req, timeout=_get_openai_timeout()) as resp:
-            raw = resp.read().decode("utf-8")
-        elapsed = (datetime.now(timezone.utc) - started_at).total_seconds()
+        resp = _get_http_client().post(url, content=data, headers=headers, timeout=_get_openai_timeout())
+        elapsed = (time.perf_counter_ns() - started_ns) / 1e9
+        if resp.status_code != 200:
+            logger.error(
+                "OpenAI HTTP %s in embeddings (%.2fs), body=%s", resp.status_code, elapsed, resp.text[:1000]
+            )
+            return []
         logger.info("OpenAI embeddings call OK (%.2fs), n=%d", elapsed, len(texts))
-        obj = json.loads(raw)
+        obj = _json_loads(resp.content)
         data_list = obj.get("data") or []
         out: List[List[float]] = []
         for row in data_list:
@@ -352,91 +879,200 @@ def call_openai_embeddings(texts: List[str], model: Optional[str] = None) -> Lis
             if isinstance(emb, list):
                 out.append([float(x) for x in emb])
         return out
-    except urllib.error.HTTPError as e:
-        elapsed = (datetime.now(timezone.utc) - started_at).total_seconds()
-        try:
-            error_body = e.read().decode("utf-8", errors="replace")
-        except Exception:
-            error_body = "<no body>"
-        logger.error("OpenAI HTTPError in embeddings (%.2fs), code=%s, body=%s", elapsed, e.code, error_body[:1000])
-        return []
     except Exception as e:
-        elapsed = (datetime.now(timezone.utc) - started_at).total_seconds()
+        elapsed = (time.perf_counter_ns() - started_ns) / 1e9
         logger.exception("Error calling OpenAI embeddings (%.2fs): %s", elapsed, e)
         return []
 
 
 # ==========
-# Генерация карточек “с нуля” (вывод всегда RU)
+# Выбор модели: малая модель для простых задач, с авто-откатом на основную,
+# если малая слишком часто отдаёт невалидный JSON
 # ==========
 
+SMALL_MODEL_CARDS_MAX_COUNT = 3
+SMALL_MODEL_MIN_SAMPLES = 10
+SMALL_MODEL_MAX_FAIL_RATE = 0.2
+SMALL_MODEL_PROMOTE_SECONDS = 600
+
+_MODEL_STATS_LOCK = threading.Lock()
+_small_model_stats: Dict[str, Any] = {"ok": 0, "bad": 0, "promoted_until": 0.0}
+
+
+def _pick_small_model() -> str:
+    with _MODEL_STATS_LOCK:
+        promoted = time.monotonic() < _small_model_stats["promoted_until"]
+    small = _get_openai_normalize_model()
+    if promoted or not _model_is_deployed(small):
+        return _openai_model()
+    return small
+
+
+@functools.lru_cache(maxsize=4)
+def _model_is_deployed(model: str) -> bool:
+    """
+    Есть ли модель в GET /models у OPENAI_BASE_URL — проверяем один раз на процесс.
+    Список получить не удалось (прокси без /models, сеть) — модель не блокируем,
+    дальше её отсеют счётчики ошибок.
+    """
+    if model == _openai_model() or not _get_openai_api_key():
+        return True
+    try:
+        listed = _json_loads(_openai_api_request("GET", "/models")).get("data") or []
+    except Exception as e:
+        logger.warning("Could not list models at %s to validate %s: %s", _get_openai_base_url(), model, e)
+        return True
+    ids = {m.get("id") for m in listed if isinstance(m, dict)}
+    if not ids or model in ids:
+        return True
+    logger.error(
+        "Model %s is not served by %s, routing small-model calls to %s", model, _get_openai_base_url(), _openai_model()
+    )
+    return False
+
+
+def _promote_main_model(model: str, reason: str) -> None:
+    with _MODEL_STATS_LOCK:
+        _small_model_stats["ok"] = _small_model_stats["bad"] = 0
+        _small_model_stats["promoted_until"] = time.monotonic() + SMALL_MODEL_PROMOTE_SECONDS
+    logger.warning("Small model %s %s, routing to %s for %ds", model, reason, _openai_model(), SMALL_MODEL_PROMOTE_SECONDS)
+
+
+def _record_model_result(model: str, ok: bool) -> None:
+    """Считаем успехи/неудачи разбора ответа только для малой модели."""
+    if model != _get_openai_normalize_model() or model == _openai_model():
+        return
+    with _MODEL_STATS_LOCK:
+        _small_model_stats["ok" if ok else "bad"] += 1
+        total = _small_model_stats["ok"] + _small_model_stats["bad"]
+        if total < SMALL_MODEL_MIN_SAMPLES:
+            return
+        fail_rate = _small_model_stats["bad"] / total
+        _small_model_stats["ok"] = _small_model_stats["bad"] = 0
+        if fail_rate <= SMALL_MODEL_MAX_FAIL_RATE:
+            return
+    _promote_main_model(model, f"fail rate {fail_rate * 100:.0f}%")
+
+
+def _record_model_http_error(model: str, status: int) -> None:
+    """
+    4xx без ретрая на малой модели: 404 (model_not_found, нет такого деплоймента) — сразу
+    переключаемся на основную; 400 и прочие — считаем неудачей наравне с невалидным JSON.
+    401/403 касаются ключа, а не модели, — их не учитываем.
+    """
+    if model != _get_openai_normalize_model() or model == _openai_model() or status in (401, 403):
+        return
+    if status == 404:
+        _promote_main_model(model, "is not found (HTTP 404)")
+    elif 400 <= status < 500:
+        _record_model_result(model, False)
 
-def generate_cards_for_tags(tags: List[str], language: str, count: int) -> List[Dict[str, Any]]:
-    if not is_configured():
-        logger.warning("OPENAI_API_KEY is not set, skip OpenAI card generation")
-        return []
 
-    # принудительно выводим на языке проекта
-    language = _output_language()
+# ==========
+# Генерация карточек “с нуля” (вывод всегда RU)
+# ==========
+
+# Фид часто обновляется “пачкой” с теми же тегами: одинаковый (tags, language, count)
+# в течение нескольких минут отдаём из памяти вместо нового вызова OpenAI.
+CARDS_CACHE_TTL_SECONDS = 300
+_CARDS_CACHE: TTLCache = TTLCache(maxsize=256, ttl=CARDS_CACHE_TTL_SECONDS)
+_CARDS_CACHE_LOCK = threading.Lock()
 
+
+def _prepare_feed_tags(tags: List[str]) -> List[str]:
     if not tags:
         tags = list(DEFAULT_FEED_TAGS)
 
     tags = _normalize_tag_list(tags, fallback=DEFAULT_FEED_TAGS)
     if not tags:
         tags = list(DEFAULT_FEED_TAGS)
+    return tags
+
 
-    system_prompt = (
-        "Ты – движок новостной ленты EYYE.\n"
-        "Сгенерируй короткие новостные карточки.\n"
-        "Каждая карточка: заголовок + 2–4 абзаца текста.\n"
-        f"ВАЖНО: пиши ТОЛЬКО на языке '{language}'.\n"
-        "Отвечай строго валидным JSON без лишнего текста.\n\n"
-        "Теги можно использовать ТОЛЬКО из этого списка:\n"
-        + ", ".join(ALLOWED_TAGS_CANONICAL)
-        + "\n\n"
-        "JSON-структура:\n"
-        "{\n"
-        '  "cards": [\n'
-        "    {\n"
-        '      "title": "...",\n'
-        '      "body": "...",\n'
-        '      "tags": ["world_news"],\n'
-        '      "importance_score": 0.7,\n'
-        f'      "language": "{language}"\n'
-        "    }\n"
-        "  ]\n"
-        "}\n"
+def _cards_cache_get(cache_key: Any) -> Optional[List[Card]]:
+    with _CARDS_CACHE_LOCK:
+        cached = _CARDS_CACHE.get(cache_key)
+    if cached is None:
+        return None
+    logger.info("OpenAI card generation cache hit: tags=%s count=%s", cache_key[0], cache_key[2])
+    return copy.deepcopy(cached)
+
+
+def _cards_cache_put(cache_key: Any, result: List[Card]) -> None:
+    if result:
+        with _CARDS_CACHE_LOCK:
+            _CARDS_CACHE[cache_key] = copy.deepcopy(result)
+
+
+# Системные промпты собираются один раз при импорте (по языку вывода) и не меняются
+# между вызовами: короче промпт — меньше input-токенов, стабильный префикс — prompt cache.
+_SYSTEM_PROMPT_CARDS = {
+    lang: (
+        "Ты — движок новостной ленты EYYE. Сгенерируй короткие новостные карточки: "
+        f"заголовок + 2–4 абзаца, только на языке '{lang}'. "
+        f"tags — только из: {_ALLOWED_TAGS_PROMPT}. "
+        "Ответ — строго валидный JSON без лишнего текста: "
+        '{"cards":[{"title":"...","body":"...","tags":["world_news"],"importance_score":0.7,'
+        f'"language":"{lang}"}}]}}'
     )
+    for lang in ("ru", "en")
+}
+
+# Prompt caching у OpenAI работает по буквальному префиксу:
+# system + требования не меняются между вызовами, переменная часть — строго в конце
+# и сериализуется детерминированно (отсортированные теги и ключи).
+_REQUIREMENTS_CARDS = {
+    "type": "text",
+    "text": (
+        "Требования:\n"
+        "- Карточки должны быть интересными и понятными.\n"
+        "- Не выдумывай точные факты про конкретных реальных людей.\n"
+        "- Избегай кликбейта, но делай заголовки цепляющими.\n"
+        "- НЕ делай одинаковые заголовки у разных карточек."
+    ),
+}
+
+
+# Бюджет ответа по числу карточек: лишний лимит не ускоряет, а потолок 1200 для маленьких count
+# только раздувает хвост латентности, если модель разговорится.
+CARDS_MAX_OUTPUT_TOKENS = 1200
+CARDS_TOKENS_PER_CARD = 250
+
+
+def _cards_max_output_tokens(count: int) -> int:
+    return min(CARDS_MAX_OUTPUT_TOKENS, CARDS_TOKENS_PER_CARD * max(1, count) + 100)
 
-    user_payload = {
-        "output_language": language,
-        "count": count,
-        "tags": tags,
-        "requirements": [
-            "Карточки должны быть интересными и понятными.",
-            "Не выдумывай точные факты про конкретных реальных людей.",
-            "Избегай кликбейта, но делай заголовки цепляющими.",
-            "НЕ делай одинаковые заголовки у разных карточек.",
-        ],
-    }
 
-    payload: Dict[str, Any] = {
-        "model": _openai_model(),
+# Переменная часть запроса карточек: ключи в алфавитном порядке, как дал бы sort_keys;
+# сериализуем только список тегов, остальное подставляем в готовый шаблон.
+_CARDS_USER_TMPL = '{"count":%d,"output_language":"%s","tags":%s}'
+
+
+def _build_cards_payload(tags: List[str], language: str, count: int) -> Dict[str, Any]:
+    system_prompt = _SYSTEM_PROMPT_CARDS[language]
+    user_text = _CARDS_USER_TMPL % (count, language, _json_dumps_str(sorted(tags)))
+
+    return {
+        "model": _pick_small_model() if count <= SMALL_MODEL_CARDS_MAX_COUNT else _openai_model(),
         "messages": [
             {"role": "system", "content": system_prompt},
-            {"role": "user", "content": json.dumps(user_payload, ensure_ascii=False)},
+            {
+                "role": "user",
+                "content": [
+                    _REQUIREMENTS_CARDS,
+                    {"type": "text", "text": user_text},
+                ],
+            },
         ],
-        "max_output_tokens": 1200,
+        "max_output_tokens": _cards_max_output_tokens(count),
         "temperature": 0.7,
         "response_format": {"type": "json_object"},
+        "prompt_cache_key": "eyye:cards:v1",
+        "stream": _env("OPENAI_STREAM", "").strip().lower() in ("1", "true", "yes"),
     }
 
-    started = time.monotonic()
-    resp_json = call_openai_chat(payload)
-    elapsed = time.monotonic() - started
-    logger.info("OpenAI card generation call finished in %.2fs", elapsed)
 
+def _cards_from_response(resp_json: Dict[str, Any], tags: List[str], language: str) -> List[Card]:
     if not resp_json:
         return []
 
@@ -445,153 +1081,550 @@ def generate_cards_for_tags(tags: List[str], language: str, count: int) -> List[
         logger.error("Empty content in OpenAI cards response")
         return []
 
-    raw_cards: List[Dict[str, Any]] = []
-    try:
-        parsed = json.loads(content_str)
-        if isinstance(parsed, dict):
-            raw_cards = parsed.get("cards") or parsed.get("items") or []
-        elif isinstance(parsed, list):
-            raw_cards = parsed
-    except Exception:
-        parsed_loose = _try_loose_json_parse(content_str)
-        if parsed_loose is not None:
-            raw_cards = parsed_loose.get("cards") or parsed_loose.get("items") or []
-
-    if not raw_cards:
+    parsed = _parse_model_json(content_str)
+    if parsed is None:
+        # без ключа "title" карточек там нет (ошибка/отказ модели) — не гоняем парсеры впустую
+        if '"title"' not in content_str:
+            logger.error("OpenAI cards response is not JSON and has no cards")
+            return []
+        # оборванный по max_tokens ответ: незакрытые скобки добирает partial-парсер
+        parsed = _try_partial_json_parse(content_str)
+
+    raw_cards: Any = []
+    if isinstance(parsed, dict):
+        raw_cards = parsed.get("cards") or parsed.get("items") or []
+    elif isinstance(parsed, list):
+        raw_cards = parsed
+
+    if not isinstance(raw_cards, list) or not raw_cards:
         return []
 
-    seen_titles = set()
-    result: List[Dict[str, Any]] = []
+    choices = resp_json.get("choices") or [{}]
+    if choices[0].get("finish_reason") == "length" and len(raw_cards) > 1:
+        # ответ оборван по max_tokens: последняя карточка почти наверняка недописана
+        raw_cards = raw_cards[:-1]
 
-    def norm_title(t: str) -> str:
-        t = (t or "").strip().lower()
-        t = re.sub(r"[\s\.\,\!\?\:\;\-–—]+", " ", t)
-        return " ".join(t.split())
+    seen_titles: set = set()
+    return [card for card in (_finalize_card(c, tags, language, seen_titles) for c in raw_cards) if card is not None]
 
-    for c in raw_cards:
-        if not isinstance(c, dict):
-            continue
 
-        title = _clean_text(c.get("title"), 160)
-        body = _clean_text(c.get("body") or c.get("summary"), 2600)
-        if not title or not body:
-            continue
+def _norm_title(t: str) -> str:
+    """Ключ для дедупа заголовков: без регистра, пунктуации и лишних пробелов."""
+    return " ".join((t or "").lower().translate(_TITLE_PUNCT_TRANS).split())
 
-        nt = norm_title(title)
-        if nt and nt in seen_titles:
-            continue
 
-        tags_out = _normalize_tag_list(c.get("tags"), fallback=tags)
-        importance = _clamp01(c.get("importance_score", c.get("importance", 0.6)))
+def _finalize_card(c: Any, tags: List[str], language: str, seen_titles: Optional[set] = None) -> Optional[Card]:
+    """
+    Сырая карточка модели -> валидная карточка ленты (None, если нет заголовка/текста или это дубль).
+    seen_titles — общий для ответа набор ключей _norm_title: дубль отсекаем до разбора body и тегов.
+    """
+    if not isinstance(c, dict):
+        return None
+
+    title = _clean_text(c.get("title"), 160)
+    if not title:
+        return None
+    nt = _norm_title(title) if seen_titles is not None else ""
+    if nt and nt in seen_titles:
+        return None
 
-        result.append(
-            {
-                "title": title,
-                "body": body,
-                "tags": tags_out,
-                "importance_score": importance,
-                "language": language,
-                "quality": "ok",
-            }
-        )
-        if nt:
-            seen_titles.add(nt)
+    body = _clean_text(c.get("body") or c.get("summary"), 2600)
+    if not body:
+        return None
+    if nt:
+        seen_titles.add(nt)
+
+    return {
+        "title": title,
+        "body": body,
+        "tags": _normalize_tag_list(c.get("tags"), fallback=tags),
+        "importance_score": _clamp01(c.get("importance_score", c.get("importance", 0.6))),
+        "language": language,
+        "quality": "ok",
+    }
+
+
+def generate_cards_for_tags(tags: List[str], language: str, count: int) -> List[Card]:
+    if not is_configured():
+        logger.warning("OPENAI_API_KEY is not set, skip OpenAI card generation")
+        return []
+
+    # принудительно выводим на языке проекта
+    language = _output_language()
+    tags = _prepare_feed_tags(tags)
+
+    cache_key = (tuple(sorted(tags)), language, count, _openai_model())
+    cached = _cards_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    fanout = _get_cards_fanout()
+    started_ns = time.perf_counter_ns()
+    if fanout > 1 and count > 1 and len(tags) > 1 and not _event_loop_running():
+
+        async def _run() -> List[Card]:
+            try:
+                return await _generate_cards_fanout(tags, language, count, fanout)
+            finally:
+                await close_async_client()
+
+        result = asyncio.run(_run())
+    else:
+        payload = _build_cards_payload(tags, language, count)
+        resp_json = call_openai_chat(payload)
+        result = _cards_from_response(resp_json, tags, language)
+        if resp_json:
+            _record_model_result(payload["model"], bool(result))
+    elapsed = (time.perf_counter_ns() - started_ns) / 1e9
+    logger.info("OpenAI card generation call finished in %.2fs", elapsed)
 
+    _cards_cache_put(cache_key, result)
     return result
 
 
 # ==========
-# Нормализация Wikipedia → карточка (вывод всегда на языке проекта)
+# Нормализация Telegram-поста → карточка (вывод всегда на языке проекта)
 # ==========
 
+# Каналы часто перепостят/слегка правят один и тот же текст: кэшируем результат
+# по хэшу нормализованного текста (регистр, пунктуация и пробелы не влияют на ключ).
+_TG_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=24 * 3600)
+_TG_CACHE_LOCK = threading.Lock()
+_TG_CACHE_STATS = {"hits": 0, "misses": 0, "logged_at": time.monotonic()}
+_TG_CACHE_KEY_PUNCT_RE = re.compile(r"[^\w\s]+")
+
+
+def _telegram_cache_key(raw_text: str, out_lang: str) -> str:
+    text = _TG_CACHE_KEY_PUNCT_RE.sub(" ", _clean_text(raw_text, 20000).lower())
+    text = " ".join(text.split())
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{out_lang}:{_get_openai_normalize_model()}:{digest}"
+
+
+def _telegram_cache_get(key: str, input_lang_hint: str) -> Optional[NormalizedCard]:
+    with _TG_CACHE_LOCK:
+        cached = _TG_CACHE.get(key)
+        _TG_CACHE_STATS["hits" if cached is not None else "misses"] += 1
+        now = time.monotonic()
+        if now - _TG_CACHE_STATS["logged_at"] >= 60:
+            logger.info(
+                "Telegram normalize cache: hits=%d misses=%d size=%d",
+                _TG_CACHE_STATS["hits"],
+                _TG_CACHE_STATS["misses"],
+                len(_TG_CACHE),
+            )
+            _TG_CACHE_STATS["logged_at"] = now
+    if cached is None:
+        return None
+    out = copy.deepcopy(cached)
+    out["input_language_hint"] = input_lang_hint
+    return out
 
-def normalize_wikipedia_article(*, title_hint: str, raw_text: str, language: str, why_now: str) -> Dict[str, Any]:
-    input_lang_hint = (language or "ru").strip().lower()
-    out_lang = _output_language()
 
-    def _fallback() -> Dict[str, Any]:
-        first = (title_hint or "").strip() or "Статья"
-        body = _clean_text(raw_text, 1400) or first
-        return {
-            "title": first[:200],
-            "body": body,
-            "tags": [],
-            "importance_score": 0.6,
-            "language": out_lang,
-            "source_name": None,
-            "why_now": _clean_text(why_now, 220),
-            "quality": "fallback_raw",
-            "input_language_hint": input_lang_hint,
-        }
+def _telegram_cache_put(key: str, card: NormalizedCard) -> None:
+    # fallback-карточки не кэшируем: в следующий раз OpenAI может ответить нормально
+    if card.get("quality") == "ok":
+        with _TG_CACHE_LOCK:
+            _TG_CACHE[key] = copy.deepcopy(card)
 
-    if not is_configured():
-        return _fallback()
 
-    system_prompt = (
-        "Ты нормализуешь выдержку из Wikipedia в формат карточки EYYE.\n"
-        "КРИТИЧНО:\n"
-        f"- Пиши итоговую карточку ТОЛЬКО на языке '{out_lang}'.\n"
-        f"- Если исходный текст/why_now на другом языке, переведи смысл на '{out_lang}', не добавляя фактов.\n"
-        "Важно:\n"
-        "- НЕ выдумывай факты.\n"
-        "- Пиши как короткая новостная заметка: нейтрально, компактно.\n"
-        "- tags: только из списка:\n"
-        f"  {', '.join(ALLOWED_TAGS_CANONICAL)}.\n"
-        f"- language: всегда '{out_lang}'\n"
-        "Верни валидный JSON-объект."
-    )
+def _telegram_fallback(raw_text: str, channel_title: str, input_lang_hint: str, out_lang: str) -> NormalizedCard:
+    text = (raw_text or "").strip()
+    first_line = text.split("\n", 1)[0].strip() if text else ""
+    title = _clean_text(first_line, 200) or (channel_title or "").strip() or "Новость"
+    return {
+        "title": title,
+        "body": _clean_text(text, 1400) or title,
+        "tags": [],
+        "importance_score": 0.5,
+        "language": out_lang,
+        "source_name": None,
+        "quality": "fallback_raw",
+        "input_language_hint": input_lang_hint,
+    }
 
-    user_prompt = (
-        f"input_language_hint: {input_lang_hint}\n"
-        f"output_language: {out_lang}\n"
-        f"title_hint: {title_hint}\n"
-        f"why_now_hint (translate to output_language, keep meaning): {why_now}\n\n"
-        "text:\n"
-        "-------------------\n"
-        f"{(raw_text or '').strip()}\n"
-        "-------------------\n\n"
-        "JSON:\n"
-        "{\n"
-        '  "title": "...",\n'
-        '  "body": "...",\n'
-        '  "tags": ["world_news"],\n'
-        '  "importance_score": 0.7,\n'
-        f'  "language": "{out_lang}",\n'
-        '  "source_name": null,\n'
-        '  "why_now": "..."\n'
-        "}"
+
+_SYSTEM_PROMPT_NORMALIZE = {
+    lang: (
+        "Нормализуй пост Telegram-канала в карточку ленты EYYE. "
+        f"Язык карточки — только '{lang}' (пост на другом языке: переведи смысл, без новых фактов). "
+        "title — до 120 символов, нейтрально, без эмодзи и кликбейта; body — 2–4 коротких абзаца по сути. "
+        "Факты, цифры, цитаты — только из поста; без рекламы, хэштегов, ссылок и упоминаний Telegram/канала. "
+        f"tags — 1–3 из: {_ALLOWED_TAGS_PROMPT}. "
+        "importance_score — 0..1, важность для широкой аудитории. "
+        "source_name — первоисточник, если явно назван в посте, иначе null. "
+        'Ответ — JSON-объект: {"title":"...","body":"...","tags":["world_news"],"importance_score":0.6,'
+        f'"language":"{lang}","source_name":null}}'
     )
+    for lang in ("ru", "en")
+}
 
-    payload: Dict[str, Any] = {
-        "model": _openai_wikipedia_model(),
+
+TELEGRAM_LLM_MAX_CHARS = 3500
+
+
+def _build_telegram_payload(raw_text: str, channel_title: str, input_lang_hint: str, out_lang: str) -> Dict[str, Any]:
+    system_prompt = _SYSTEM_PROMPT_NORMALIZE[out_lang]
+    post = _trim_for_llm(raw_text, TELEGRAM_LLM_MAX_CHARS)
+    # переменные поля — строго в конце сообщения
+    user_prompt = f"input_language_hint: {input_lang_hint}\nchannel_title: {channel_title}\npost:\n{post}"
+
+    return {
+        "model": _pick_small_model(),
         "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ],
-        "max_output_tokens": 420,
-        "temperature": 0.2,
+        # короткий пост — короткая карточка: 600 токенов хватает с запасом
+        "max_output_tokens": 600 if len(post) < 800 else 800,
+        "temperature": 0.3,
         "response_format": {"type": "json_object"},
+        "prompt_cache_key": "eyye:telegram:v1",
+        # фоновая индексация некритична по латентности: OPENAI_SERVICE_TIER=flex дешевле
+        "service_tier": _env("OPENAI_SERVICE_TIER", "").strip() or None,
     }
 
-    resp_json = call_openai_chat(payload)
+
+def _telegram_card_from_response(
+    resp_json: Dict[str, Any],
+    raw_text: str,
+    channel_title: str,
+    input_lang_hint: str,
+    out_lang: str,
+) -> NormalizedCard:
     if not resp_json:
-        return _fallback()
+        return _telegram_fallback(raw_text, channel_title, input_lang_hint, out_lang)
 
     content_str = _extract_message_content(resp_json).strip()
     if not content_str:
-        return _fallback()
+        return _telegram_fallback(raw_text, channel_title, input_lang_hint, out_lang)
+
+    parsed = _parse_model_json(content_str)
+
+    if not isinstance(parsed, dict):
+        return _telegram_fallback(raw_text, channel_title, input_lang_hint, out_lang)
+
+    out_title = _clean_text(parsed.get("title"), 220)
+    out_body = _clean_text(parsed.get("body"), 2600)
+    if not out_title or not out_body:
+        return _telegram_fallback(raw_text, channel_title, input_lang_hint, out_lang)
+
+    out_source = parsed.get("source_name")
+    if isinstance(out_source, str):
+        out_source = out_source.strip() or None
+    else:
+        out_source = None
+
+    return {
+        "title": out_title,
+        "body": out_body,
+        "tags": _normalize_tag_list(parsed.get("tags"), fallback=[]),
+        "importance_score": _clamp01(parsed.get("importance_score", 0.5)),
+        "language": out_lang,
+        "source_name": out_source,
+        "quality": "ok",
+        "input_language_hint": input_lang_hint,
+    }
+
+
+def normalize_telegram_post(*, raw_text: str, channel_title: str, language: str) -> NormalizedCard:
+    input_lang_hint = (language or "ru").strip().lower()
+    out_lang = _output_language()
+
+    if not is_configured():
+        return _telegram_fallback(raw_text, channel_title, input_lang_hint, out_lang)
+
+    cache_key = _telegram_cache_key(raw_text, out_lang)
+    cached = _telegram_cache_get(cache_key, input_lang_hint)
+    if cached is not None:
+        return cached
+
+    payload = _build_telegram_payload(raw_text, channel_title, input_lang_hint, out_lang)
+    resp_json = call_openai_chat(payload)
+    card = _telegram_card_from_response(resp_json, raw_text, channel_title, input_lang_hint, out_lang)
+    if resp_json:
+        _record_model_result(payload["model"], card.get("quality") == "ok")
+    _telegram_cache_put(cache_key, card)
+    return card
+
 
-    parsed: Any = None
+# ==========
+# Нормализация Wikipedia → карточка (вывод всегда на языке проекта)
+# ==========
+
+
+# короче этого (или почти только заголовок) модели нечего нормализовать — хватит fallback-карточки
+WIKIPEDIA_MIN_TEXT_LEN = 80
+WIKIPEDIA_LLM_MAX_CHARS = 3000
+
+
+def _wikipedia_text_too_short(title_hint: str, raw_text: str) -> bool:
+    text = (raw_text or "").strip()
+    title = (title_hint or "").strip()
+    return len(text) < WIKIPEDIA_MIN_TEXT_LEN or len(text) < len(title) + 20 or text == title
+
+
+# Одни и те же статьи повторно попадают в выборку (топ просмотров держится днями):
+# кэшируем готовую карточку по хэшу (title_hint, why_now, текст), как и для Telegram.
+_WIKI_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=24 * 3600)
+_WIKI_CACHE_LOCK = threading.Lock()
+
+
+def _wikipedia_cache_key(title_hint: str, raw_text: str, why_now: str, out_lang: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for part in (title_hint, why_now, raw_text):
+        h.update(" ".join((part or "").split()).encode("utf-8"))
+        h.update(b"\x00")
+    return f"{out_lang}:{_openai_wikipedia_model()}:{h.hexdigest()}"
+
+
+# Ingest Wikipedia запускается отдельным процессом по расписанию — in-process кэш между
+# запусками пуст. При заданном REDIS_URL второй уровень — Redis (ключ eyye:wiki:<key>, 7 дней).
+# Вызовы redis-py блокирующие: из async-кода — только через asyncio.to_thread.
+WIKI_REDIS_TTL_SECONDS = 7 * 24 * 3600
+# Redis недоступен — не платим таймауты на каждую статью, выключаем уровень на время
+WIKI_REDIS_BACKOFF_SECONDS = 60
+_wiki_redis: Any = None
+_wiki_redis_failed = False
+_wiki_redis_down_until = 0.0
+
+
+def _get_wiki_redis() -> Any:
+    global _wiki_redis, _wiki_redis_failed
+    if _wiki_redis is None and not _wiki_redis_failed and redis is not None:
+        url = _env("REDIS_URL", "").strip()
+        if not url:
+            _wiki_redis_failed = True
+            return None
+        try:
+            _wiki_redis = redis.Redis.from_url(url, socket_timeout=1.0, socket_connect_timeout=1.0)
+        except Exception:
+            logger.warning("Invalid REDIS_URL, Wikipedia Redis cache disabled", exc_info=True)
+            _wiki_redis_failed = True
+    if _wiki_redis is not None and time.monotonic() < _wiki_redis_down_until:
+        return None
+    return _wiki_redis
+
+
+def _wiki_redis_error(op: str, e: Exception) -> None:
+    global _wiki_redis_down_until
+    if isinstance(e, (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError)):
+        _wiki_redis_down_until = time.monotonic() + WIKI_REDIS_BACKOFF_SECONDS
+        logger.warning(
+            "Wikipedia Redis cache %s failed (%s), disabled for %ds", op, e, WIKI_REDIS_BACKOFF_SECONDS
+        )
+    else:
+        logger.warning("Wikipedia Redis cache %s failed: %s", op, e)
+
+
+def _wiki_redis_load(key: str) -> Optional[Dict[str, Any]]:
+    r = _get_wiki_redis()
+    if r is None:
+        return None
     try:
-        parsed = json.loads(content_str)
-    except Exception:
-        parsed = _try_loose_json_parse(content_str)
+        raw = r.get(f"eyye:wiki:{key}")
+        cached = _json_loads(raw) if raw else None
+    except Exception as e:
+        _wiki_redis_error("read", e)
+        return None
+    # fallback-карточки, записанные раньше с недельным TTL, не отдаём — пусть статья нормализуется заново
+    if not isinstance(cached, dict) or cached.get("quality") != "ok":
+        return None
+    with _WIKI_CACHE_LOCK:
+        _WIKI_CACHE[key] = cached
+    return cached
+
+
+def _wiki_redis_store(key: str, card: WikipediaCard) -> None:
+    # в Redis (TTL неделя) пишем только реально распарсенные карточки
+    if card.get("quality") != "ok":
+        return
+    r = _get_wiki_redis()
+    if r is None:
+        return
+    try:
+        r.setex(f"eyye:wiki:{key}", WIKI_REDIS_TTL_SECONDS, _json_dumps_bytes(card))
+    except Exception as e:
+        _wiki_redis_error("write", e)
+
+
+def _wikipedia_cache_get(key: str, input_lang_hint: str, use_redis: bool = True) -> Optional[WikipediaCard]:
+    with _WIKI_CACHE_LOCK:
+        cached = _WIKI_CACHE.get(key)
+    if cached is None and use_redis:
+        cached = _wiki_redis_load(key)
+    return _wikipedia_cached_copy(cached, input_lang_hint)
+
+
+def _wikipedia_cached_copy(cached: Optional[Dict[str, Any]], input_lang_hint: str) -> Optional[WikipediaCard]:
+    if cached is None:
+        return None
+    out = copy.deepcopy(cached)
+    out["input_language_hint"] = input_lang_hint
+    return out
+
+
+def _wikipedia_cache_put(key: str, card: WikipediaCard, use_redis: bool = True) -> None:
+    if card.get("quality") != "ok":
+        return
+    with _WIKI_CACHE_LOCK:
+        _WIKI_CACHE[key] = copy.deepcopy(card)
+    if use_redis:
+        _wiki_redis_store(key, card)
+
+
+async def _wikipedia_cache_get_async(key: str, input_lang_hint: str) -> Optional[WikipediaCard]:
+    cached = _wikipedia_cache_get(key, input_lang_hint, use_redis=False)
+    if cached is None and _get_wiki_redis() is not None:
+        cached = _wikipedia_cached_copy(await asyncio.to_thread(_wiki_redis_load, key), input_lang_hint)
+    return cached
+
+
+async def _wikipedia_cache_put_async(key: str, card: WikipediaCard) -> None:
+    _wikipedia_cache_put(key, card, use_redis=False)
+    if card.get("quality") == "ok" and _get_wiki_redis() is not None:
+        await asyncio.to_thread(_wiki_redis_store, key, card)
 
+
+def _wikipedia_fallback(
+    title_hint: str, raw_text: str, why_now: str, input_lang_hint: str, out_lang: str
+) -> WikipediaCard:
+    first = (title_hint or "").strip() or "Статья"
+    body = _clean_text(raw_text, 1400) or first
+    return {
+        "title": first[:200],
+        "body": body,
+        "tags": [],
+        "importance_score": 0.6,
+        "language": out_lang,
+        "source_name": None,
+        "why_now": _clean_text(why_now, 220),
+        "quality": "fallback_raw",
+        "input_language_hint": input_lang_hint,
+    }
+
+
+_SYSTEM_PROMPT_WIKIPEDIA = {
+    lang: (
+        "Ты нормализуешь выдержку из Wikipedia в формат карточки EYYE.\n"
+        "КРИТИЧНО:\n"
+        f"- Пиши итоговую карточку ТОЛЬКО на языке '{lang}'.\n"
+        f"- Если исходный текст/why_now на другом языке, переведи смысл на '{lang}', не добавляя фактов.\n"
+        "Важно:\n"
+        "- НЕ выдумывай факты.\n"
+        "- Пиши как короткая новостная заметка: нейтрально, компактно.\n"
+        "- tags: только из списка:\n"
+        f"  {_ALLOWED_TAGS_PROMPT}.\n"
+        f"- language: всегда '{lang}'\n"
+        "Верни валидный JSON-объект."
+    )
+    for lang in ("ru", "en")
+}
+
+# статичная часть user-промпта: подставляются только hint'ы и текст статьи
+_WIKI_USER_PROMPT_TMPL = {
+    lang: (
+        "input_language_hint: {input_lang_hint}\n"
+        f"output_language: {lang}\n"
+        "title_hint: {title_hint}\n"
+        "why_now_hint (translate to output_language, keep meaning): {why_now}\n\n"
+        "text:\n"
+        "-------------------\n"
+        "{text}\n"
+        "-------------------\n\n"
+        "JSON:\n"
+        "{{\n"
+        '  "title": "...",\n'
+        '  "body": "...",\n'
+        '  "tags": ["world_news"],\n'
+        '  "importance_score": 0.7,\n'
+        f'  "language": "{lang}",\n'
+        '  "source_name": null,\n'
+        '  "why_now": "..."\n'
+        "}}"
+    )
+    for lang in ("ru", "en")
+}
+
+
+# Неизменная часть запроса собрана один раз: на вызов — только user-сообщение и модель
+# (модель не фиксируем: _pick_small_model может временно переключить её на основную).
+_WIKI_SYSTEM_MESSAGE = {lang: {"role": "system", "content": prompt} for lang, prompt in _SYSTEM_PROMPT_WIKIPEDIA.items()}
+_WIKI_PAYLOAD_TEMPLATE = MappingProxyType(
+    {
+        "temperature": 0.2,
+        "response_format": {"type": "json_object"},
+        "prompt_cache_key": "eyye:wikipedia:v1",
+    }
+)
+
+
+# ответ оборван по лимиту (finish_reason=length) — повторяем один раз с этим бюджетом
+WIKIPEDIA_RETRY_MAX_OUTPUT_TOKENS = 900
+
+
+def _wikipedia_max_output_tokens(text: str) -> int:
+    # пересказ не длиннее исходника, но JSON-обёртка, title/why_now/tags и кириллица
+    # (2–3 токена на слово) съедают заметную часть бюджета даже для короткой выдержки
+    n = len(text)
+    return 420 if n < 400 else 520 if n < 1200 else 640
+
+
+def _response_truncated(resp_json: Dict[str, Any]) -> bool:
+    return bool(resp_json) and (resp_json.get("choices") or [{}])[0].get("finish_reason") == "length"
+
+
+def _build_wikipedia_payload(
+    title_hint: str, raw_text: str, why_now: str, input_lang_hint: str, out_lang: str
+) -> Dict[str, Any]:
+    text = _trim_for_llm(raw_text, WIKIPEDIA_LLM_MAX_CHARS)
+    user_prompt = _WIKI_USER_PROMPT_TMPL[out_lang].format_map(
+        {
+            "input_lang_hint": input_lang_hint,
+            "title_hint": title_hint,
+            "why_now": why_now,
+            "text": text,
+        }
+    )
+
+    payload = dict(_WIKI_PAYLOAD_TEMPLATE)
+    payload["max_output_tokens"] = _wikipedia_max_output_tokens(text)
+    payload["model"] = _openai_wikipedia_model()
+    payload["messages"] = [_WIKI_SYSTEM_MESSAGE[out_lang], {"role": "user", "content": user_prompt}]
+    return payload
+
+
+def _wikipedia_card_from_response(
+    resp_json: Dict[str, Any], title_hint: str, raw_text: str, why_now: str, input_lang_hint: str, out_lang: str
+) -> WikipediaCard:
+    if not resp_json:
+        return _wikipedia_fallback(title_hint, raw_text, why_now, input_lang_hint, out_lang)
+
+    content_str = _extract_message_content(resp_json).strip()
+    if not content_str:
+        return _wikipedia_fallback(title_hint, raw_text, why_now, input_lang_hint, out_lang)
+
+    card = _wikipedia_card_from_parsed(
+        _parse_model_json(content_str), title_hint, raw_text, why_now, input_lang_hint, out_lang
+    )
+    # ответ оборван по max_tokens — карточка недописана: не выдаём её за нормальную (и не кэшируем)
+    if _response_truncated(resp_json):
+        card["quality"] = "fallback_raw"
+    return card
+
+
+def _wikipedia_card_from_parsed(
+    parsed: Any, title_hint: str, raw_text: str, why_now: str, input_lang_hint: str, out_lang: str
+) -> WikipediaCard:
     if not isinstance(parsed, dict):
         parsed = {}
 
     out_title = _clean_text(parsed.get("title"), 220) or _clean_text(title_hint, 220) or "Статья"
-    out_body = _clean_text(parsed.get("body"), 2600) or _clean_text(raw_text, 1400)
+    out_body = _clean_text(parsed.get("body"), 2600)
+    # без body от модели карточка собрана из сырого (непереведённого) текста — это fallback
+    parsed_ok = bool(out_body)
+    if not parsed_ok:
+        out_body = _clean_text(raw_text, 1400)
 
     out_tags = _normalize_tag_list(parsed.get("tags"), fallback=[])
     out_importance = _clamp01(parsed.get("importance_score", 0.6))
@@ -611,6 +1644,804 @@ def normalize_wikipedia_article(*, title_hint: str, raw_text: str, language: str
         "language": out_lang,
         "source_name": out_source,
         "why_now": out_why,
-        "quality": "ok",
+        "quality": "ok" if parsed_ok else "fallback_raw",
         "input_language_hint": input_lang_hint,
     }
+
+
+def normalize_wikipedia_article(*, title_hint: str, raw_text: str, language: str, why_now: str) -> WikipediaCard:
+    input_lang_hint = (language or "ru").strip().lower()
+    out_lang = _output_language()
+
+    if not is_configured() or _wikipedia_text_too_short(title_hint, raw_text):
+        return _wikipedia_fallback(title_hint, raw_text, why_now, input_lang_hint, out_lang)
+
+    cache_key = _wikipedia_cache_key(title_hint, raw_text, why_now, out_lang)
+    cached = _wikipedia_cache_get(cache_key, input_lang_hint)
+    if cached is not None:
+        return cached
+
+    payload = _build_wikipedia_payload(title_hint, raw_text, why_now, input_lang_hint, out_lang)
+    resp_json = call_openai_chat(payload)
+    if _response_truncated(resp_json) and payload["max_output_tokens"] < WIKIPEDIA_RETRY_MAX_OUTPUT_TOKENS:
+        payload["max_output_tokens"] = WIKIPEDIA_RETRY_MAX_OUTPUT_TOKENS
+        resp_json = call_openai_chat(payload)
+    card = _wikipedia_card_from_response(resp_json, title_hint, raw_text, why_now, input_lang_hint, out_lang)
+    _record_model_result(payload["model"], card.get("quality") == "ok")
+    _wikipedia_cache_put(cache_key, card)
+    return card
+
+
+_SYSTEM_PROMPT_WIKIPEDIA_BULK = {
+    lang: (
+        _SYSTEM_PROMPT_WIKIPEDIA[lang]
+        + "\nНа входе — несколько статей (articles), каждую нормализуй отдельно, id сохраняй как есть. "
+        'Ответ: {"cards":[{"id":0,"title":"...","body":"...","tags":["world_news"],"importance_score":0.7,'
+        f'"language":"{lang}","source_name":null,"why_now":"..."}}]}}'
+    )
+    for lang in ("ru", "en")
+}
+
+
+def _build_wikipedia_bulk_payload(articles: Dict[int, Tuple[str, str, str, str]], out_lang: str) -> Dict[str, Any]:
+    """articles: {id: (title_hint, raw_text, why_now, input_lang_hint)} → один запрос на все статьи."""
+    user_articles = [
+        {
+            "id": i,
+            "input_language_hint": hint,
+            "title_hint": title_hint,
+            "why_now_hint": why_now,
+            "text": _trim_for_llm(raw_text, WIKIPEDIA_LLM_MAX_CHARS),
+        }
+        for i, (title_hint, raw_text, why_now, hint) in articles.items()
+    ]
+    return {
+        "model": _openai_wikipedia_model(),
+        "messages": [
+            {"role": "system", "content": _SYSTEM_PROMPT_WIKIPEDIA_BULK[out_lang]},
+            {"role": "user", "content": _json_dumps_str({"articles": user_articles}, sort_keys=True)},
+        ],
+        "max_output_tokens": sum(_wikipedia_max_output_tokens(a["text"]) for a in user_articles),
+        "temperature": 0.2,
+        "response_format": {"type": "json_object"},
+        "prompt_cache_key": "eyye:wikipedia-bulk:v1",
+    }
+
+
+def _wikipedia_bulk_cards_by_id(resp_json: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
+    """Ответ на bulk-запрос → {id: сырая карточка}; карточки без целого id пропускаем."""
+    if not resp_json:
+        return {}
+    parsed = _parse_model_json(_extract_message_content(resp_json).strip())
+    raw_cards = parsed.get("cards") if isinstance(parsed, dict) else None
+    out: Dict[int, Dict[str, Any]] = {}
+    for c in raw_cards if isinstance(raw_cards, list) else []:
+        if not isinstance(c, dict):
+            continue
+        try:
+            out.setdefault(int(c.get("id")), c)
+        except (TypeError, ValueError):
+            continue
+    return out
+
+
+def normalize_wikipedia_articles_bulk(items: List[Dict[str, str]], k: int = 8) -> List[WikipediaCard]:
+    """
+    items: [{"title_hint", "raw_text", "language", "why_now"}] → карточки в том же порядке.
+    До k статей в одном вызове chat.completions: общий system prompt оплачивается один раз на группу.
+    Статьи, которых нет в ответе модели, добираются поштучно через normalize_wikipedia_article.
+    """
+    out_lang = _output_language()
+    args = [_wikipedia_item_args(item) for item in items]
+    results: List[Optional[WikipediaCard]] = [None] * len(items)
+
+    pending: List[int] = []
+    for i, (title_hint, raw_text, why_now, hint) in enumerate(args):
+        if not is_configured() or _wikipedia_text_too_short(title_hint, raw_text):
+            results[i] = _wikipedia_fallback(title_hint, raw_text, why_now, hint, out_lang)
+        else:
+            results[i] = _wikipedia_cache_get(_wikipedia_cache_key(title_hint, raw_text, why_now, out_lang), hint)
+            if results[i] is None:
+                pending.append(i)
+
+    k = max(1, k)
+    for start in range(0, len(pending), k):
+        group = pending[start : start + k]
+        payload = _build_wikipedia_bulk_payload({i: args[i] for i in group}, out_lang)
+        by_id = _wikipedia_bulk_cards_by_id(call_openai_chat(payload))
+        _record_model_result(payload["model"], all(i in by_id for i in group))
+        for i in group:
+            if i in by_id:
+                title_hint, raw_text, why_now, hint = args[i]
+                results[i] = _wikipedia_card_from_parsed(by_id[i], title_hint, raw_text, why_now, hint, out_lang)
+                _wikipedia_cache_put(_wikipedia_cache_key(title_hint, raw_text, why_now, out_lang), results[i])
+
+    for i, card in enumerate(results):
+        if card is None:
+            title_hint, raw_text, why_now, hint = args[i]
+            results[i] = normalize_wikipedia_article(
+                title_hint=title_hint, raw_text=raw_text, language=hint, why_now=why_now
+            )
+    return [card for card in results if card is not None]
+
+
+# ==========
+# Async-клиент (httpx.AsyncClient): много вызовов конкурентно из одного event loop
+# ==========
+
+# клиент, семафор и token budget — свои у каждого event loop: потоки со своим asyncio.run
+# не закрывают и не подменяют чужой клиент; запись уходит вместе с loop
+_ASYNC_STATE: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AsyncState]" = weakref.WeakKeyDictionary()
+_ASYNC_STATE_LOCK = threading.Lock()
+
+
+def _get_openai_max_concurrency() -> int:
+    try:
+        return max(1, int(_env("OPENAI_MAX_CONCURRENT_REQUESTS", "16")))
+    except Exception:
+        return 16
+
+
+def _get_openai_max_tokens_per_min() -> int:
+    try:
+        return max(0, int(_env("OPENAI_MAX_TOKENS_PER_MIN", "0")))
+    except Exception:
+        return 0
+
+
+class _TokenBudget:
+    """Простой token bucket на минуту: грубая оценка токенов запроса, ждём пополнения."""
+
+    def __init__(self, tokens_per_min: int) -> None:
+        self.capacity = float(tokens_per_min)
+        self.available = float(tokens_per_min)
+        self.updated_at = time.monotonic()
+
+    async def acquire(self, tokens: int) -> None:
+        need = min(float(tokens), self.capacity)
+        while True:
+            now = time.monotonic()
+            self.available = min(self.capacity, self.available + (now - self.updated_at) * self.capacity / 60.0)
+            self.updated_at = now
+            if self.available >= need:
+                self.available -= need
+                return
+            await asyncio.sleep((need - self.available) * 60.0 / self.capacity)
+
+
+class _AsyncState:
+    """
+    httpx.AsyncClient (keep-alive пул, HTTP/2 при наличии h2 — запросы мультиплексируются)
+    и лимиты конкурентности одного event loop.
+    """
+
+    def __init__(self) -> None:
+        self.client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=250, max_keepalive_connections=32, keepalive_expiry=90),
+            timeout=_get_openai_timeout(),
+        )
+        self.semaphore = asyncio.Semaphore(_get_openai_max_concurrency())
+        tpm = _get_openai_max_tokens_per_min()
+        self.token_budget: Optional[_TokenBudget] = _TokenBudget(tpm) if tpm > 0 else None
+
+
+def _get_async_state() -> _AsyncState:
+    # соединения привязаны к event loop, поэтому состояние своё у каждого loop
+    loop = asyncio.get_running_loop()
+    with _ASYNC_STATE_LOCK:
+        state = _ASYNC_STATE.get(loop)
+        if state is None or state.client.is_closed:
+            state = _ASYNC_STATE[loop] = _AsyncState()
+    return state
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    return _get_async_state().client
+
+
+async def close_async_client() -> None:
+    """Закрывает клиент только текущего event loop — клиенты других потоков/loop не трогаем."""
+    with _ASYNC_STATE_LOCK:
+        state = _ASYNC_STATE.pop(asyncio.get_running_loop(), None)
+    if state is not None and not state.client.is_closed:
+        await state.client.aclose()
+
+
+async def _aread_capped(resp: httpx.Response, max_bytes: int) -> bytes:
+    buf = bytearray()
+    async for chunk in resp.aiter_bytes():
+        buf += chunk
+        if len(buf) > max_bytes:
+            break
+    return bytes(buf)
+
+
+async def call_openai_chat_async(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Async-аналог call_openai_chat: тот же формат payload/ответа, {} при ошибке."""
+    api_key = _get_openai_api_key()
+    if not api_key:
+        logger.warning("OPENAI_API_KEY is not set, skipping OpenAI call")
+        return {}
+
+    body = _build_chat_body(payload)
+    stream = bool(body.get("stream"))
+    data = _json_dumps_bytes(body)
+    headers = _auth_headers(api_key)
+    url = _chat_completions_url()
+
+    cache_path, cache_ttl = _response_cache_path(body)
+    if cache_path is not None:
+        cached = _response_cache_load(cache_path, cache_ttl)
+        if cached is not None:
+            return cached
+
+    if not _breaker_allow():
+        logger.warning("OpenAI circuit breaker is open, skipping async chat.completions call")
+        return {}
+
+    state = _get_async_state()
+    client = state.client
+    if state.token_budget is not None:
+        # грубо: ~3 байта UTF-8 на токен промпта + весь лимит на ответ
+        await state.token_budget.acquire(len(data) // 3 + int(body["max_tokens"]))
+
+    max_bytes = _get_openai_max_response_bytes()
+    attempts = _get_openai_max_retries() + 1
+    for attempt in range(1, attempts + 1):
+        started_ns = time.perf_counter_ns()
+        retry_after: Optional[float] = None
+        try:
+            async with state.semaphore:
+                async with client.stream("POST", url, content=data, headers=headers) as resp:
+                    status = resp.status_code
+                    retry_after = _retry_after_seconds(resp.headers)
+                    # Content-Length известен заранее — не читаем тело вовсе
+                    if int(resp.headers.get("Content-Length") or 0) > max_bytes:
+                        raw = None
+                    else:
+                        raw = await _aread_capped(resp, max_bytes)
+            elapsed = (time.perf_counter_ns() - started_ns) / 1e9
+            if raw is None or len(raw) > max_bytes:
+                logger.error("OpenAI async chat.completions response exceeds %d bytes, dropping it", max_bytes)
+                return {}
+            if status == 200:
+                _breaker_success()
+                if stream:
+                    obj = _read_chat_stream(raw.splitlines())
+                else:
+                    obj = _json_loads(raw)
+                logger.info("OpenAI chat.completions async call OK (%.2fs)", elapsed)
+                if obj and cache_path is not None:
+                    _response_cache_store(cache_path, obj)
+                return obj
+            logger.error(
+                "OpenAI HTTP %s in async chat.completions (%.2fs), body=%s",
+                status,
+                elapsed,
+                raw[:1000].decode("utf-8", errors="replace"),
+            )
+            if status not in OPENAI_RETRY_STATUS_CODES:
+                _record_model_http_error(body["model"], status)
+                return {}
+            _breaker_failure(retry_after)
+            if attempt >= attempts:
+                return {}
+        except httpx.TransportError as e:
+            elapsed = (time.perf_counter_ns() - started_ns) / 1e9
+            logger.error("OpenAI network error in async chat.completions (%.2fs): %s", elapsed, e)
+            _breaker_failure(None)
+            if attempt >= attempts:
+                return {}
+        except Exception as e:
+            elapsed = (time.perf_counter_ns() - started_ns) / 1e9
+            logger.exception("Error calling OpenAI async chat.completions (%.2fs): %s", elapsed, e)
+            return {}
+
+        delay = _retry_delay(attempt, retry_after)
+        logger.warning("Retrying OpenAI async chat.completions in %.1fs (attempt %d/%d)", delay, attempt + 1, attempts)
+        await asyncio.sleep(delay)
+        if not _breaker_allow():
+            logger.warning("OpenAI circuit breaker opened, giving up on async chat.completions retries")
+            return {}
+
+    return {}
+
+
+async def generate_cards_for_tags_async(tags: List[str], language: str, count: int) -> List[Card]:
+    if not is_configured():
+        logger.warning("OPENAI_API_KEY is not set, skip OpenAI card generation")
+        return []
+
+    language = _output_language()
+    tags = _prepare_feed_tags(tags)
+
+    cache_key = (tuple(sorted(tags)), language, count, _openai_model())
+    cached = _cards_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    fanout = _get_cards_fanout()
+    if fanout > 1 and count > 1 and len(tags) > 1:
+        result = await _generate_cards_fanout(tags, language, count, fanout)
+    else:
+        payload = _build_cards_payload(tags, language, count)
+        resp_json = await call_openai_chat_async(payload)
+        result = _cards_from_response(resp_json, tags, language)
+        if resp_json:
+            _record_model_result(payload["model"], bool(result))
+    _cards_cache_put(cache_key, result)
+    return result
+
+
+def _get_cards_fanout() -> int:
+    # EYYE_OPENAI_FANOUT=N — карточки генерируются N параллельными вызовами по группам тегов
+    try:
+        return max(1, int(_env("EYYE_OPENAI_FANOUT", "1")))
+    except Exception:
+        return 1
+
+
+def _event_loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _split_cards_request(tags: List[str], count: int, fanout: int) -> List[Tuple[List[str], int]]:
+    """Теги round-robin по n группам, count — поровну (остаток — первым группам)."""
+    n = min(fanout, count, len(tags))
+    base, extra = divmod(count, n)
+    return [(tags[i::n], base + (1 if i < extra else 0)) for i in range(n)]
+
+
+async def _generate_cards_fanout(tags: List[str], language: str, count: int, fanout: int) -> List[Card]:
+    """
+    Вместо одного длинного ответа на count карточек — несколько коротких параллельно:
+    время ≈ латентность одного маленького вызова, токены те же. Дедуп заголовков — по общему списку.
+    """
+    parts = _split_cards_request(tags, count, fanout)
+    payloads: List[Dict[str, Any]] = []
+    for group_tags, sub_count in parts:
+        # бюджет ответа _build_cards_payload считает сам по числу карточек в группе
+        payloads.append(_build_cards_payload(group_tags, language, sub_count))
+
+    responses = await asyncio.gather(*[call_openai_chat_async(payload) for payload in payloads])
+
+    seen_titles = set()
+    result: List[Card] = []
+    for (group_tags, _), payload, resp_json in zip(parts, payloads, responses):
+        cards = _cards_from_response(resp_json, group_tags, language)
+        if resp_json:
+            _record_model_result(payload["model"], bool(cards))
+        for card in cards:
+            nt = _norm_title(card["title"])
+            if nt and nt in seen_titles:
+                continue
+            if nt:
+                seen_titles.add(nt)
+            result.append(card)
+    return result[:count]
+
+
+async def normalize_telegram_post_async(*, raw_text: str, channel_title: str, language: str) -> NormalizedCard:
+    input_lang_hint = (language or "ru").strip().lower()
+    out_lang = _output_language()
+
+    if not is_configured():
+        return _telegram_fallback(raw_text, channel_title, input_lang_hint, out_lang)
+
+    cache_key = _telegram_cache_key(raw_text, out_lang)
+    cached = _telegram_cache_get(cache_key, input_lang_hint)
+    if cached is not None:
+        return cached
+
+    payload = _build_telegram_payload(raw_text, channel_title, input_lang_hint, out_lang)
+    resp_json = await call_openai_chat_async(payload)
+    card = _telegram_card_from_response(resp_json, raw_text, channel_title, input_lang_hint, out_lang)
+    if resp_json:
+        _record_model_result(payload["model"], card.get("quality") == "ok")
+    _telegram_cache_put(cache_key, card)
+    return card
+
+
+WIKI_BATCH_MAX_SIZE = 8
+
+
+def _get_wiki_batch_window() -> float:
+    """OPENAI_WIKI_BATCH_WINDOW_MS > 0 — склеивать одновременные вызовы в один bulk-запрос (по умолчанию выкл.)."""
+    try:
+        return max(0.0, float(_env("OPENAI_WIKI_BATCH_WINDOW_MS", "0"))) / 1000.0
+    except Exception:
+        return 0.0
+
+
+class _WikiBatcher:
+    """
+    Микробатчинг async-нормализации Wikipedia: статьи, пришедшие в одном окне (до max_batch штук),
+    уходят одним bulk-запросом. Каждый вызывающий ждёт свой Future с сырой карточкой
+    (None — модель её не вернула, тогда вызывающий идёт обычным одиночным путём).
+    """
+
+    def __init__(self, window: float, max_batch: int) -> None:
+        self.window = window
+        self.max_batch = max_batch
+        self.queue: "asyncio.Queue[Tuple[Tuple[str, str, str, str], asyncio.Future]]" = asyncio.Queue()
+        self.worker: Optional[asyncio.Task] = None
+        # event loop держит на задачи только слабые ссылки: без этого набора
+        # flush может собрать GC посреди запроса, и Future вызывающих так и не разрешатся
+        self._inflight: set = set()
+
+    async def submit(self, args: Tuple[str, str, str, str]) -> Optional[Dict[str, Any]]:
+        fut = asyncio.get_running_loop().create_future()
+        await self.queue.put((args, fut))
+        if self.worker is None or self.worker.done():
+            self.worker = asyncio.create_task(self._run())
+        return await fut
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # отправку не ждём: следующее окно собирается, пока этот запрос в полёте
+            task = asyncio.create_task(self._flush(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    @staticmethod
+    async def _flush(batch: List[Tuple[Tuple[str, str, str, str], asyncio.Future]]) -> None:
+        try:
+            payload = _build_wikipedia_bulk_payload({i: args for i, (args, _) in enumerate(batch)}, _output_language())
+            by_id = _wikipedia_bulk_cards_by_id(await call_openai_chat_async(payload))
+            _record_model_result(payload["model"], len(by_id) >= len(batch))
+        except Exception:
+            logger.exception("OpenAI Wikipedia micro-batch of %d failed", len(batch))
+            by_id = {}
+        for i, (_, fut) in enumerate(batch):
+            if not fut.done():
+                fut.set_result(by_id.get(i))
+
+
+_WIKI_BATCHERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _WikiBatcher]" = weakref.WeakKeyDictionary()
+
+
+def _get_wiki_batcher(window: float) -> _WikiBatcher:
+    # очередь и Future привязаны к event loop — как и AsyncClient, свой батчер у каждого loop
+    loop = asyncio.get_running_loop()
+    with _ASYNC_STATE_LOCK:
+        batcher = _WIKI_BATCHERS.get(loop)
+        if batcher is None:
+            batcher = _WIKI_BATCHERS[loop] = _WikiBatcher(window, WIKI_BATCH_MAX_SIZE)
+    return batcher
+
+
+async def normalize_wikipedia_article_async(
+    *, title_hint: str, raw_text: str, language: str, why_now: str
+) -> WikipediaCard:
+    input_lang_hint = (language or "ru").strip().lower()
+    out_lang = _output_language()
+
+    if not is_configured() or _wikipedia_text_too_short(title_hint, raw_text):
+        return _wikipedia_fallback(title_hint, raw_text, why_now, input_lang_hint, out_lang)
+
+    cache_key = _wikipedia_cache_key(title_hint, raw_text, why_now, out_lang)
+    cached = await _wikipedia_cache_get_async(cache_key, input_lang_hint)
+    if cached is not None:
+        return cached
+
+    window = _get_wiki_batch_window()
+    if window > 0:
+        raw_card = await _get_wiki_batcher(window).submit((title_hint, raw_text, why_now, input_lang_hint))
+        if raw_card is not None:
+            card = _wikipedia_card_from_parsed(raw_card, title_hint, raw_text, why_now, input_lang_hint, out_lang)
+            await _wikipedia_cache_put_async(cache_key, card)
+            return card
+
+    payload = _build_wikipedia_payload(title_hint, raw_text, why_now, input_lang_hint, out_lang)
+    resp_json = await call_openai_chat_async(payload)
+    if _response_truncated(resp_json) and payload["max_output_tokens"] < WIKIPEDIA_RETRY_MAX_OUTPUT_TOKENS:
+        payload["max_output_tokens"] = WIKIPEDIA_RETRY_MAX_OUTPUT_TOKENS
+        resp_json = await call_openai_chat_async(payload)
+    card = _wikipedia_card_from_response(resp_json, title_hint, raw_text, why_now, input_lang_hint, out_lang)
+    _record_model_result(payload["model"], card.get("quality") == "ok")
+    await _wikipedia_cache_put_async(cache_key, card)
+    return card
+
+
+async def normalize_wikipedia_article_many(items: List[Dict[str, str]]) -> List[WikipediaCard]:
+    """
+    items: [{"title_hint", "raw_text", "language", "why_now"}] → карточки в том же порядке.
+    Все запросы идут конкурентно через общий AsyncClient (не больше OPENAI_MAX_CONCURRENT_REQUESTS разом).
+    """
+    return list(
+        await asyncio.gather(
+            *[
+                normalize_wikipedia_article_async(
+                    title_hint=item.get("title_hint") or "",
+                    raw_text=item.get("raw_text") or "",
+                    language=item.get("language") or "ru",
+                    why_now=item.get("why_now") or "",
+                )
+                for item in items
+            ]
+        )
+    )
+
+
+# ==========
+# OpenAI Batch API: фоновые массовые нормализации (~50% дешевле, 1 upload + poll вместо N POST)
+# ==========
+
+
+def _openai_api_request(method: str, path: str, data: Optional[bytes] = None, content_type: str = "application/json") -> bytes:
+    """Синхронный запрос к произвольному endpoint OpenAI API. Бросает исключение при ошибке."""
+    headers = {"Authorization": f"Bearer {_get_openai_api_key()}"}
+    if data is not None:
+        headers["Content-Type"] = content_type
+    url = _get_openai_base_url().rstrip("/") + path
+    resp = _get_http_client().request(method, url, content=data, headers=headers, timeout=_get_openai_timeout())
+    resp.raise_for_status()
+    return resp.content
+
+
+def _get_openai_batch_wait_seconds() -> float:
+    try:
+        return max(0.0, float(_env("OPENAI_BATCH_WAIT_SECONDS", "3600")))
+    except Exception:
+        return 3600.0
+
+
+def submit_chat_batch(requests: List[Tuple[str, Dict[str, Any]]]) -> Optional[str]:
+    """
+    requests: [(custom_id, payload)] в том же формате payload, что и call_openai_chat.
+    Возвращает batch_id или None, если загрузка/создание батча не удались.
+    """
+    if not requests or not is_configured():
+        return None
+
+    lines: List[bytes] = []
+    for custom_id, payload in requests:
+        body = _build_chat_body(payload)
+        body.pop("stream", None)
+        body.pop("service_tier", None)
+        lines.append(
+            _json_dumps_bytes(
+                {"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body}
+            )
+        )
+
+    boundary = uuid.uuid4().hex
+    multipart = b"".join(
+        [
+            f'--{boundary}\r\nContent-Disposition: form-data; name="purpose"\r\n\r\nbatch\r\n'.encode("utf-8"),
+            f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="batch.jsonl"\r\n'
+            "Content-Type: application/jsonl\r\n\r\n".encode("utf-8"),
+            b"\n".join(lines),
+            f"\r\n--{boundary}--\r\n".encode("utf-8"),
+        ]
+    )
+
+    try:
+        file_obj = _json_loads(
+            _openai_api_request("POST", "/files", multipart, f"multipart/form-data; boundary={boundary}")
+        )
+        batch_obj = _json_loads(
+            _openai_api_request(
+                "POST",
+                "/batches",
+                _json_dumps_bytes(
+                    {
+                        "input_file_id": file_obj["id"],
+                        "endpoint": "/v1/chat/completions",
+                        "completion_window": "24h",
+                    }
+                ),
+            )
+        )
+    except Exception:
+        logger.exception("Failed to submit OpenAI batch (n=%d)", len(requests))
+        return None
+
+    batch_id = batch_obj.get("id")
+    logger.info("OpenAI batch submitted: id=%s n=%d", batch_id, len(requests))
+    return batch_id
+
+
+def collect_chat_batch(batch_id: str, wait_seconds: Optional[float] = None, poll_interval: float = 15.0) -> Dict[str, Dict[str, Any]]:
+    """
+    Ждёт завершения батча (не дольше wait_seconds) и возвращает {custom_id: ответ chat.completions}.
+    Неуспешные/не дождавшиеся элементы в результат не попадают.
+    """
+    if not batch_id:
+        return {}
+    deadline = time.monotonic() + (_get_openai_batch_wait_seconds() if wait_seconds is None else wait_seconds)
+
+    batch_obj: Dict[str, Any] = {}
+    while True:
+        try:
+            batch_obj = _json_loads(_openai_api_request("GET", f"/batches/{batch_id}"))
+        except Exception:
+            logger.exception("Failed to poll OpenAI batch %s", batch_id)
+            return {}
+        status = batch_obj.get("status")
+        if status in ("completed", "failed", "expired", "cancelled"):
+            break
+        if time.monotonic() >= deadline:
+            logger.warning("OpenAI batch %s still %s, giving up waiting", batch_id, status)
+            return {}
+        time.sleep(poll_interval)
+
+    output_file_id = batch_obj.get("output_file_id")
+    if not output_file_id:
+        logger.error("OpenAI batch %s finished with status=%s and no output", batch_id, batch_obj.get("status"))
+        return {}
+
+    try:
+        raw = _openai_api_request("GET", f"/files/{output_file_id}/content")
+    except Exception:
+        logger.exception("Failed to download OpenAI batch output %s", output_file_id)
+        return {}
+
+    out: Dict[str, Dict[str, Any]] = {}
+    for line in raw.splitlines():
+        if not line.strip():
+            continue
+        try:
+            row = _json_loads(line)
+        except ValueError:
+            continue
+        response = row.get("response") or {}
+        if response.get("status_code") == 200 and isinstance(response.get("body"), dict):
+            out[str(row.get("custom_id"))] = response["body"]
+    logger.info("OpenAI batch %s collected: %d results", batch_id, len(out))
+    return out
+
+
+def _wikipedia_item_args(item: Dict[str, str]) -> Tuple[str, str, str, str]:
+    """item → (title_hint, raw_text, why_now, input_lang_hint) для payload/разбора ответа."""
+    return (
+        item.get("title_hint") or "",
+        item.get("raw_text") or "",
+        item.get("why_now") or "",
+        (item.get("language") or "ru").strip().lower(),
+    )
+
+
+def submit_wikipedia_batch(items: List[Dict[str, str]]) -> Optional[str]:
+    """
+    items: [{"title_hint", "raw_text", "language", "why_now"}] → batch_id (None при ошибке).
+    Тела запросов — те же, что строит normalize_wikipedia_article.
+    """
+    if not items:
+        return None
+    out_lang = _output_language()
+    # слишком короткие статьи в батч не отправляем — collect_wikipedia_batch отдаст для них fallback
+    requests = [
+        (f"wiki-{i}", _build_wikipedia_payload(*_wikipedia_item_args(item), out_lang))
+        for i, item in enumerate(items)
+        if not _wikipedia_text_too_short(item.get("title_hint") or "", item.get("raw_text") or "")
+    ]
+    return submit_chat_batch(requests)
+
+
+def collect_wikipedia_batch(
+    batch_id: Optional[str], items: List[Dict[str, str]], wait_seconds: Optional[float] = None
+) -> List[WikipediaCard]:
+    """
+    Ждёт батч из submit_wikipedia_batch и возвращает карточки в порядке items
+    (те же items, что ушли в submit). Не дождались/ошибка по элементу — fallback-карточка.
+    """
+    out_lang = _output_language()
+    responses = collect_chat_batch(batch_id or "", wait_seconds=wait_seconds)
+    small_model = _get_openai_normalize_model()
+    cards: List[WikipediaCard] = []
+    for i, item in enumerate(items):
+        resp_json = responses.get(f"wiki-{i}") or {}
+        card = _wikipedia_card_from_response(resp_json, *_wikipedia_item_args(item), out_lang)
+        # модель из payload к этому моменту не сохранилась — берём ту, что отдал API (с суффиксом даты)
+        served = str(resp_json.get("model") or "")
+        if served == small_model or served.startswith(small_model + "-"):
+            _record_model_result(small_model, card.get("quality") == "ok")
+        cards.append(card)
+    return cards
+
+
+def _use_openai_batch() -> bool:
+    return _env("OPENAI_USE_BATCH", "").strip().lower() in ("1", "true", "yes")
+
+
+OPENAI_BULK_MODES = ("async", "threaded", "batch")
+
+
+def _get_openai_bulk_mode() -> str:
+    """OPENAI_BULK_MODE: async (по умолчанию) | threaded | batch; OPENAI_USE_BATCH=1 — старый синоним batch."""
+    if _use_openai_batch():
+        return "batch"
+    mode = _env("OPENAI_BULK_MODE", "async").strip().lower()
+    return mode if mode in OPENAI_BULK_MODES else "async"
+
+
+def _get_openai_bulk_threads() -> int:
+    try:
+        return max(1, int(_env("OPENAI_BULK_THREADS", "16")))
+    except Exception:
+        return 16
+
+
+def normalize_telegram_posts_bulk(posts: List[Tuple[str, str, str]]) -> List[NormalizedCard]:
+    """
+    posts: [(raw_text, channel_title, language)] → карточки в том же порядке.
+    OPENAI_BULK_MODE=batch — через Batch API, threaded — пул потоков над sync-клиентом,
+    иначе конкурентно через async-клиент (внутри уже запущенного event loop — тоже потоки).
+    """
+    if not posts:
+        return []
+
+    out_lang = _output_language()
+    hints = [(language or "ru").strip().lower() for _, _, language in posts]
+
+    if not is_configured():
+        return [
+            _telegram_fallback(raw_text, channel_title, hint, out_lang)
+            for (raw_text, channel_title, _), hint in zip(posts, hints)
+        ]
+
+    mode = _get_openai_bulk_mode()
+    if mode == "batch":
+        keys = [_telegram_cache_key(raw_text, out_lang) for raw_text, _, _ in posts]
+        results: List[Optional[NormalizedCard]] = [
+            _telegram_cache_get(key, hint) for key, hint in zip(keys, hints)
+        ]
+        requests = [
+            (f"post-{i}", _build_telegram_payload(raw_text, channel_title, hints[i], out_lang))
+            for i, (raw_text, channel_title, _) in enumerate(posts)
+            if results[i] is None
+        ]
+        responses = collect_chat_batch(submit_chat_batch(requests) or "") if requests else {}
+        for i, (raw_text, channel_title, _) in enumerate(posts):
+            if results[i] is None:
+                card = _telegram_card_from_response(
+                    responses.get(f"post-{i}") or {}, raw_text, channel_title, hints[i], out_lang
+                )
+                _telegram_cache_put(keys[i], card)
+                results[i] = card
+        return [card for card in results if card is not None]
+
+    if mode == "async" and not _event_loop_running():
+
+        async def _run() -> List[NormalizedCard]:
+            try:
+                return list(
+                    await asyncio.gather(
+                        *[
+                            normalize_telegram_post_async(
+                                raw_text=raw_text, channel_title=channel_title, language=language
+                            )
+                            for raw_text, channel_title, language in posts
+                        ]
+                    )
+                )
+            finally:
+                await close_async_client()
+
+        return asyncio.run(_run())
+
+    # threaded (или уже внутри event loop, где asyncio.run нельзя): общий httpx.Client потокобезопасен
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(_get_openai_bulk_threads(), len(posts))) as pool:
+        return list(
+            pool.map(
+                lambda post: normalize_telegram_post(raw_text=post[0], channel_title=post[1], language=post[2]),
+                posts,
+            )
+        )
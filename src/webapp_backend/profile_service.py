@@ -1,13 +1,45 @@
 # file: src/webapp_backend/profile_service.py
+import copy
 import json
 import logging
+import threading
 from typing import Any, Dict, List, Optional
 
+from cachetools import TTLCache
+from postgrest.types import ReturnMethod
 from supabase import Client
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+# ===== Кэш строк user_profiles =====
+
+# Фид и /api/profile читают профиль на каждый запрос, а меняется он редко (онбординг).
+# Держим строку в памяти недолго; отсутствие профиля — ещё короче, чтобы новый
+# пользователь после онбординга в другом процессе не ждал минуту.
+PROFILE_CACHE_TTL_SECONDS = 60
+PROFILE_MISS_CACHE_TTL_SECONDS = 10
+
+_profile_cache: TTLCache = TTLCache(maxsize=10_000, ttl=PROFILE_CACHE_TTL_SECONDS)
+_profile_miss_cache: TTLCache = TTLCache(maxsize=10_000, ttl=PROFILE_MISS_CACHE_TTL_SECONDS)
+_profile_cache_lock = threading.RLock()
+
+# ошибку запроса не кэшируем — в отличие от честного "профиля нет"
+_FETCH_FAILED: Any = object()
+
+
+def invalidate_profile_cache(user_id: int) -> None:
+    """Сбросить закэшированную строку профиля (после записи в user_profiles)."""
+    with _profile_cache_lock:
+        _profile_cache.pop(user_id, None)
+        _profile_miss_cache.pop(user_id, None)
+
+
 # ===== Внутренние утилиты для user_profiles =====
 
 
@@ -16,29 +48,47 @@ def _get_profile_row_by_user_id(
     user_id: int,
 ) -> Optional[Dict[str, Any]]:
     """
-    Достаём одну строку из user_profiles по user_id.
+    Достаём одну строку из user_profiles по user_id (через TTL-кэш).
 
-    ВАЖНО: в схеме нет колонки id, поэтому выбираем только user_id и structured_profile.
+    ВАЖНО: в схеме нет колонки id; вызывающим нужен только structured_profile — его и выбираем.
     """
+    with _profile_cache_lock:
+        if user_id in _profile_miss_cache:
+            return None
+        cached = _profile_cache.get(user_id)
+    if cached is not None:
+        # копия: save_onboarding правит structured_profile на месте
+        return copy.deepcopy(cached)
+
+    row = _fetch_profile_row(supabase, user_id)
+    if row is not _FETCH_FAILED:
+        with _profile_cache_lock:
+            if row is None:
+                _profile_miss_cache[user_id] = True
+            else:
+                _profile_cache[user_id] = copy.deepcopy(row)
+    return None if row is _FETCH_FAILED else row
+
+
+def _fetch_profile_row(supabase: Client, user_id: int) -> Any:
     try:
         resp = (
             supabase.table("user_profiles")
-            .select("user_id, structured_profile")
+            .select("structured_profile")
             .eq("user_id", user_id)
             .limit(1)
             .execute()
         )
     except Exception:
         logger.exception("Failed to load user_profiles row for user_id=%s", user_id)
-        return None
+        return _FETCH_FAILED
 
+    # не maybe_single(): часть версий postgrest на ноль строк (новый пользователь)
+    # бросает APIError 204 или возвращает None вместо ответа
     data = getattr(resp, "data", None)
-    if data is None:
-        data = getattr(resp, "model", None)
-    rows = data or []
-    if not rows:
+    if not isinstance(data, list) or not data or not isinstance(data[0], dict):
         return None
-    return rows[0]
+    return data[0]
 
 
 def _parse_structured_profile(value: Any) -> Optional[Dict[str, Any]]:
@@ -53,7 +103,7 @@ def _parse_structured_profile(value: Any) -> Optional[Dict[str, Any]]:
 
     if isinstance(value, str):
         try:
-            obj = json.loads(value)
+            obj = orjson.loads(value) if orjson is not None else json.loads(value)
             if isinstance(obj, dict):
                 return obj
         except Exception:
@@ -63,6 +113,13 @@ def _parse_structured_profile(value: Any) -> Optional[Dict[str, Any]]:
     return None
 
 
+def _clean_tags(tags: Any) -> List[str]:
+    """interests_as_tags → список непустых строк без дублей (порядок сохраняется)."""
+    if not isinstance(tags, list):
+        return []
+    return list(dict.fromkeys(s for s in (str(t).strip() for t in tags) if s))
+
+
 # ===== Публичные функции для API и фида =====
 
 
@@ -94,16 +151,7 @@ def get_profile_summary(
         return default
 
     city = structured.get("city") or None
-    tags = structured.get("interests_as_tags") or []
-
-    if not isinstance(tags, list):
-        tags = []
-
-    clean_tags: List[str] = []
-    for t in tags:
-        s = str(t).strip()
-        if s and s not in clean_tags:
-            clean_tags.append(s)
+    clean_tags = _clean_tags(structured.get("interests_as_tags"))
 
     has_onboarding = bool(city or clean_tags)
 
@@ -130,7 +178,12 @@ def save_onboarding(
     if supabase is None:
         return
 
-    row = _get_profile_row_by_user_id(supabase, user_id)
+    # read-modify-write всего structured_profile: читаем мимо кэша, иначе затрём
+    # свежие правки других писателей (telemetry, вектора) устаревшей копией
+    row = _fetch_profile_row(supabase, user_id)
+    if row is _FETCH_FAILED:
+        logger.warning("Onboarding for user_id=%s not saved: could not read user_profiles row", user_id)
+        return
     structured: Dict[str, Any]
 
     if row and row.get("structured_profile") is not None:
@@ -160,7 +213,9 @@ def save_onboarding(
             "structured_profile": structured,
         }
         try:
-            supabase.table("user_profiles").insert(payload).execute()
+            # ответ не читаем — просим PostgREST не возвращать строку (Prefer: return=minimal)
+            supabase.table("user_profiles").insert(payload, returning=ReturnMethod.minimal).execute()
+            invalidate_profile_cache(user_id)
         except Exception:
             logger.exception(
                 "Failed to insert user_profile for user_id=%s", user_id
@@ -169,8 +224,9 @@ def save_onboarding(
     else:
         try:
             supabase.table("user_profiles").update(
-                {"structured_profile": structured}
+                {"structured_profile": structured}, returning=ReturnMethod.minimal
             ).eq("user_id", user_id).execute()
+            invalidate_profile_cache(user_id)
         except Exception:
             logger.exception(
                 "Failed to update user_profile for user_id=%s", user_id
@@ -196,14 +252,4 @@ def get_interest_tags_for_user(
     if not structured:
         return []
 
-    tags = structured.get("interests_as_tags") or []
-    if not isinstance(tags, list):
-        return []
-
-    cleaned: List[str] = []
-    for t in tags:
-        s = str(t).strip()
-        if s and s not in cleaned:
-            cleaned.append(s)
-
-    return cleaned
+    return _clean_tags(structured.get("interests_as_tags"))
@@ -8,6 +8,8 @@ from typing import Any, Dict, List, Optional, Literal, Tuple
 
 from pydantic import BaseModel, Field
 
+from .profile_service import invalidate_profile_cache
+
 logger = logging.getLogger(__name__)
 
 # ==============================
@@ -393,6 +395,7 @@ def _maybe_update_user_reading_profile(
         supabase.table("user_profiles").update({"structured_profile": prof}).eq(key, tg_id).execute()
     except Exception:
         return
+    invalidate_profile_cache(tg_id)
 
 
 # ==============================
@@ -525,34 +528,35 @@ def _update_user_topic_weights(
             w = 0.0
         current[tag] = w
 
+    # теги, совпадающие после нормализации, схлопываем заранее: одна строка на (tg_id, tag) в upsert
+    merged: Dict[str, float] = defaultdict(float)
     for tag, delta in tag_deltas.items():
         tag_norm = tag.strip().lower()
-        if not tag_norm:
-            continue
+        if tag_norm:
+            merged[tag_norm] += float(delta)
 
-        old = current.get(tag_norm, 0.0)
-        new = old + float(delta)
+    upsert_rows: List[Dict[str, Any]] = []
+    for tag_norm, delta in merged.items():
+        new = current.get(tag_norm, 0.0) + delta
 
         if new > 10.0:
             new = 10.0
         elif new < -10.0:
             new = -10.0
 
-        try:
-            if tag_norm in current:
-                (
-                    supabase.table("user_topic_weights")
-                    .update({"weight": new})
-                    .eq("tg_id", tg_id)
-                    .eq("tag", tag_norm)
-                    .execute()
-                )
-            else:
-                supabase.table("user_topic_weights").insert({"tg_id": tg_id, "tag": tag_norm, "weight": new}).execute()
-        except Exception:
-            logger.exception("Failed to upsert user_topic_weights for tg_id=%s, tag=%r", tg_id, tag_norm)
+        upsert_rows.append({"tg_id": tg_id, "tag": tag_norm, "weight": new})
+
+    if not upsert_rows:
+        return
+
+    # один round-trip вместо update/insert на каждый тег
+    try:
+        supabase.table("user_topic_weights").upsert(upsert_rows, on_conflict="tg_id,tag").execute()
+    except Exception:
+        logger.exception("Failed to upsert user_topic_weights for tg_id=%s, tags=%d", tg_id, len(upsert_rows))
+        return
 
-    logger.info("Updated user_topic_weights for tg_id=%s, tags=%d", tg_id, len(tag_deltas))
+    logger.info("Updated user_topic_weights for tg_id=%s, tags=%d", tg_id, len(upsert_rows))
 
 
 # ==============================